@@ -18,17 +18,79 @@ Clases:
 - CommandInterface: Interfaz principal de comandos
 """
 
+from __future__ import annotations
+
 # Importación de módulos del sistema
 import os
 import sys
+import shlex
 import shutil
 from datetime import datetime
+from functools import lru_cache
 
-from .file_system import FileSystem
+from .file_system import FileSystem, Directory, format_size
 from .process_manager import ProcessManager
 from .memory_manager import MemoryManager
 from .user_manager import UserManager
 
+__all__ = ['CommandInterface']
+
+# Texto de ayuda del comando help (no cambia: se comparte entre todas las llamadas)
+_HELP_TEXT = """
+        Comandos disponibles:
+        - help: Muestra esta ayuda
+        - mkdir <nombre>: Crea un directorio
+        - cd <ruta>: Cambia de directorio
+        - ls [ruta]: Lista archivos
+        - du [ruta]: Muestra el tamaño de un archivo o directorio
+        - touch <nombre>: Crea un archivo
+        - cat <archivo>: Muestra contenido de archivo
+        - echo <texto> > <archivo>: Escribe en archivo
+        - rm <archivo>: Elimina archivo
+        - pwd: Muestra directorio actual
+        - exit: Cierra la terminal
+        """
+
+# Comandos que reciben el resto de la línea tal cual, sin dividir (conserva los espacios)
+_RAW_TAIL_COMMANDS = frozenset({'echo'})
+
+# Caracteres que obligan a pasar por shlex (comillas y escapes)
+_SHLEX_SPECIAL = frozenset('"\'\\')
+
+# Separadores de shlex pasados a espacios, para dividir sin él las líneas sin comillas
+_SHLEX_WHITESPACE = str.maketrans('\t\r\n', '   ')
+
+@lru_cache(maxsize=128)
+def _tokenize(command):
+    """
+    Divide una línea de comando en partes, respetando comillas.
+    
+    Las líneas se repiten mucho en una sesión (ls, pwd, cd ..), así que las últimas
+    se guardan ya divididas.
+    
+    Args:
+        command: Línea de comando
+    
+    Returns:
+        tuple: Nombre del comando en minúsculas y sus argumentos (vacía si no hay nada)
+    """
+    words = command.split(None, 1)
+    if words and words[0].lower() in _RAW_TAIL_COMMANDS:
+        return (sys.intern(words[0].lower()), *words[1:])
+    if _SHLEX_SPECIAL.isdisjoint(command):
+        # Sin comillas ni escapes shlex solo separa por sus espacios: se hace directamente
+        parts = [part for part in command.translate(_SHLEX_WHITESPACE).split(' ') if part]
+    else:
+        # Si las comillas están desbalanceadas se separa por espacios como antes
+        try:
+            parts = shlex.split(command)
+        except ValueError:
+            parts = command.split()
+    if not parts:
+        return ()
+    # El nombre se interna: la búsqueda en la tabla de comandos compara por identidad
+    return (sys.intern(parts[0].lower()), *parts[1:])
+
 class CommandInterface:
     """
     Implementa la interfaz de comandos del sistema operativo.
@@ -42,6 +104,9 @@ class CommandInterface:
         commands: Diccionario de comandos disponibles
     """
     
+    __slots__ = ('file_system', 'process_manager', 'memory_manager', 'user_manager',
+                 'current_dir', 'commands', '_dispatch')
+    
     def __init__(self, file_system, process_manager, memory_manager, user_manager):
         """
         Inicializa la interfaz de comandos.
@@ -64,6 +129,7 @@ class CommandInterface:
             "mkdir": self.mkdir,
             "cd": self.cd,
             "ls": self.ls,
+            "du": self.du,
             "touch": self.touch,
             "cat": self.cat,
             "echo": self.echo,
@@ -71,6 +137,9 @@ class CommandInterface:
             "pwd": self.pwd,
             "exit": self.exit
         }
+        # Búsqueda en la tabla de comandos ligada una sola vez, para no resolver
+        # self.commands.get en cada ejecución
+        self._dispatch = self.commands.get
 
     def execute_command(self, command):
         """
@@ -83,19 +152,17 @@ class CommandInterface:
             str: Resultado de la ejecución del comando
         """
         try:
-            # Divide el comando en partes
-            parts = command.split()
+            parts = _tokenize(command)
             if not parts:
                 return ""
                 
-            cmd = parts[0].lower()
-            args = parts[1:]
+            cmd = parts[0]
             
-            # Verifica si el comando existe
-            if cmd in self.commands:
-                return self.commands[cmd](*args)
-            else:
+            # Busca el comando en la tabla de comandos (una sola consulta)
+            handler = self._dispatch(cmd)
+            if handler is None:
                 return f"Comando no encontrado: {cmd}"
+            return handler(*parts[1:])
                 
         except Exception as e:
             return f"Error al ejecutar el comando: {str(e)}"
@@ -107,20 +174,7 @@ class CommandInterface:
         Returns:
             str: Lista de comandos y su descripción
         """
-        help_text = """
-        Comandos disponibles:
-        - help: Muestra esta ayuda
-        - mkdir <nombre>: Crea un directorio
-        - cd <ruta>: Cambia de directorio
-        - ls [ruta]: Lista archivos
-        - touch <nombre>: Crea un archivo
-        - cat <archivo>: Muestra contenido de archivo
-        - echo <texto> > <archivo>: Escribe en archivo
-        - rm <archivo>: Elimina archivo
-        - pwd: Muestra directorio actual
-        - exit: Cierra la terminal
-        """
-        return help_text
+        return _HELP_TEXT
 
     def mkdir(self, *args):
         """
@@ -179,16 +233,32 @@ class CommandInterface:
             if not items:
                 return "Directorio vacío"
                 
-            result = []
-            for item in items:
-                if item.is_directory:
-                    result.append(f"[DIR] {item.name}")
-                else:
-                    result.append(f"[FILE] {item.name}")
-            return "\n".join(result)
+            # El tipo de cada entrada sale de su propia clase: una comprobación
+            # por item, sin volver a resolver rutas en el sistema de archivos.
+            # join recibe una lista: con un generador tendría que construirla él
+            return "\n".join([
+                f"[DIR] {item.name}" if isinstance(item, Directory) else f"[FILE] {item.name}"
+                for item in items
+            ])
         except Exception as e:
             return f"Error al listar directorio: {str(e)}"
 
+    def du(self, *args):
+        """
+        Muestra el tamaño de un archivo o directorio.
+        
+        Args:
+            *args: Ruta opcional a medir
+            
+        Returns:
+            str: Tamaño con su unidad
+        """
+        path = self.file_system.resolve_path(self.current_dir, args[0]) if args else self.current_dir
+        try:
+            return f"{format_size(self.file_system.get_size(path))}\t{path}"
+        except Exception as e:
+            return f"Error al calcular tamaño: {str(e)}"
+
     def touch(self, *args):
         """
         Crea un nuevo archivo.
@@ -234,16 +304,33 @@ class CommandInterface:
         Escribe texto en un archivo.
         
         Args:
-            *args: Texto y nombre del archivo
+            *args: Resto de la línea sin dividir (texto, '>' y nombre del archivo)
             
         Returns:
             str: Mensaje de éxito o error
         """
-        if len(args) < 3 or args[-2] != ">":
+        # El texto se toma de la línea tal cual, sin volver a unir palabras, así que
+        # conserva sus espacios; el último '>' debe ir separado por espacios
+        text, sep, target = (args[0] if args else "").rpartition(">")
+        if not sep or not text[-1:].isspace() or not target[:1].isspace() or not text.strip():
             return "Uso: echo <texto> > <archivo>"
-            
-        text = " ".join(args[:-2])
-        file_name = args[-1]
+        try:
+            names = shlex.split(target)
+        except ValueError:
+            names = []
+        if len(names) != 1:
+            return "Uso: echo <texto> > <archivo>"
+        
+        text = text.strip()
+        # Un texto entrecomillado entero ("hola   mundo") se escribe sin las comillas
+        if text[0] in "\"'":
+            try:
+                words = shlex.split(text)
+            except ValueError:
+                words = []
+            if len(words) == 1:
+                text = words[0]
+        file_name = names[0]
         try:
             self.file_system.write_file(self.current_dir, file_name, text)
             return f"Texto escrito en: {file_name}"
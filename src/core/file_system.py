@@ -17,14 +17,39 @@ Clases:
 - File: Representa un archivo
 - Directory: Representa un directorio
 - FileSystem: Sistema de archivos principal
+
+Funciones:
+----------
+- format_size(): Formatea un tamaño en bytes con su unidad
 """
 
 # Importación de módulos del sistema
 import os
 import json
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Union
 
+# Unidades de tamaño; cada una es 2**10 veces la anterior
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+def format_size(size: int) -> str:
+    """
+    Formatea un tamaño en bytes con su unidad.
+    
+    La unidad sale directamente de la cantidad de bits del tamaño, sin probar
+    unidad por unidad.
+    
+    Args:
+        size: Tamaño en bytes
+        
+    Returns:
+        str: Tamaño formateado, por ejemplo "1.5 KB"
+    """
+    idx = min((size.bit_length() - 1) // 10, len(_UNITS) - 1) if size > 0 else 0
+    return f"{size / (1 << (idx * 10)):.1f} {_UNITS[idx]}"
+
 class File:
     """
     Representa un archivo en el sistema.
@@ -161,6 +186,9 @@ class FileSystem:
         root: Directorio raíz
         current_path: Ruta actual
         data_file: Archivo de persistencia
+        _size_cache: Tamaños de directorio ya calculados, por ruta
+        _path_cache: Items ya resueltos, por ruta
+        _io_pool: Hilo que escribe el archivo de persistencia
     """
     
     def __init__(self, data_file: str = "filesystem.json"):
@@ -173,6 +201,10 @@ class FileSystem:
         self.root = Directory("/")
         self.current_path = "/"
         self.data_file = data_file
+        self._size_cache: Dict[str, int] = {}
+        self._path_cache: Dict[str, Optional[Union[File, Directory]]] = {}
+        # Un único hilo: las escrituras se hacen en el orden en que se pidieron
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
         self.load()
 
     def load(self):
@@ -184,23 +216,63 @@ class FileSystem:
                 with open(self.data_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self.root = Directory.from_dict(data)
+                    self._size_cache.clear()
+                    self._path_cache.clear()
         except Exception as e:
             print(f"Error al cargar sistema de archivos: {str(e)}")
 
     def save(self):
         """
         Guarda el sistema de archivos en el archivo de persistencia.
+        
+        Toda modificación del árbol pasa por aquí, así que también descarta las
+        rutas resueltas y los tamaños de directorio memorizados.
+        
+        El árbol se serializa en el hilo que llama; la escritura en disco se hace en
+        _io_pool para no bloquear la interfaz.
         """
+        self._size_cache.clear()
+        self._path_cache.clear()
         try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.root.to_dict(), f, indent=2)
+            data = json.dumps(self.root.to_dict(), indent=2)
         except Exception as e:
             print(f"Error al guardar sistema de archivos: {str(e)}")
+            return
+        self._io_pool.submit(self._write_data, data)
+
+    def _write_data(self, data: str):
+        """
+        Escribe el árbol serializado en el archivo de persistencia.
+        
+        Se escribe en un archivo temporal que luego reemplaza al original, para que
+        un cierre a mitad de escritura no deje el archivo truncado.
+        
+        Args:
+            data: Árbol serializado en JSON
+        """
+        try:
+            tmp_file = self.data_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_file, self.data_file)
+        except Exception as e:
+            print(f"Error al guardar sistema de archivos: {str(e)}")
+
+    def close(self):
+        """
+        Termina las escrituras pendientes y libera el hilo de _io_pool.
+        
+        Se llama al cerrar la aplicación; después ya no se puede guardar.
+        """
+        self._io_pool.shutdown(wait=True)
 
     def get_item(self, path: str) -> Optional[Union[File, Directory]]:
         """
         Obtiene un archivo o directorio por su ruta.
         
+        El resultado se memoriza por ruta (también si no existe) hasta la siguiente
+        modificación, así que repetir una ruta no vuelve a recorrer el árbol.
+        
         Args:
             path: Ruta del item
             
@@ -210,14 +282,19 @@ class FileSystem:
         if path == "/":
             return self.root
             
-        parts = path.strip("/").split("/")
-        current = self.root
-        
-        for part in parts:
-            if part not in current.items:
-                return None
-            current = current.items[part]
+        key = path.strip("/")
+        try:
+            return self._path_cache[key]
+        except KeyError:
+            pass
             
+        current = self.root
+        for part in key.split("/"):
+            current = current.items.get(part) if isinstance(current, Directory) else None
+            if current is None:
+                break
+                
+        self._path_cache[key] = current
         return current
 
     def create_file(self, directory: str, name: str, content: str = "") -> File:
@@ -266,10 +343,9 @@ class FileSystem:
         if not isinstance(parent, Directory):
             raise ValueError(f"Directorio no encontrado: {directory}")
             
-        if name not in parent.items:
+        file = parent.items.get(name)
+        if file is None:
             raise ValueError(f"Archivo no encontrado: {name}")
-            
-        file = parent.items[name]
         if not isinstance(file, File):
             raise ValueError(f"No es un archivo: {name}")
             
@@ -291,10 +367,9 @@ class FileSystem:
         if not isinstance(parent, Directory):
             raise ValueError(f"Directorio no encontrado: {directory}")
             
-        if name not in parent.items:
+        file = parent.items.get(name)
+        if file is None:
             raise ValueError(f"Archivo no encontrado: {name}")
-            
-        file = parent.items[name]
         if not isinstance(file, File):
             raise ValueError(f"No es un archivo: {name}")
             
@@ -319,10 +394,9 @@ class FileSystem:
         if not isinstance(parent, Directory):
             raise ValueError(f"Directorio no encontrado: {directory}")
             
-        if name not in parent.items:
+        if parent.items.pop(name, None) is None:
             raise ValueError(f"Item no encontrado: {name}")
             
-        del parent.items[name]
         parent.modified_at = datetime.now()
         self.save()
 
@@ -372,6 +446,64 @@ class FileSystem:
             
         return list(directory.items.values())
 
+    def get_size(self, path: str) -> int:
+        """
+        Obtiene el tamaño en bytes de un archivo o directorio.
+        
+        El tamaño de un directorio se calcula recorriendo su subárbol con una pila
+        explícita y se memoriza hasta la siguiente modificación del sistema.
+        
+        Args:
+            path: Ruta del item
+            
+        Returns:
+            int: Tamaño en bytes
+            
+        Raises:
+            ValueError: Si el item no existe
+        """
+        item = self.get_item(path)
+        if item is None:
+            raise ValueError(f"Item no encontrado: {path}")
+        if isinstance(item, File):
+            return item.size
+            
+        key = path.strip("/")
+        size = self._size_cache.get(key)
+        if size is None:
+            size = 0
+            pending = [item]
+            while pending:
+                for child in pending.pop().items.values():
+                    if isinstance(child, Directory):
+                        pending.append(child)
+                    else:
+                        size += child.size
+            self._size_cache[key] = size
+        return size
+
+    def resolve_path(self, current: str, target: str) -> str:
+        """
+        Obtiene la ruta absoluta de un destino relativo al directorio actual.
+        
+        Las rutas del sistema usan siempre "/", sea cual sea el sistema anfitrión. Solo
+        se normalizan las que tienen componentes "." o ".."; el resto se concatena.
+        
+        Args:
+            current: Directorio actual (absoluto)
+            target: Ruta destino, absoluta o relativa
+            
+        Returns:
+            str: Ruta absoluta
+        """
+        if target.startswith("/"):
+            path = target
+        else:
+            path = current.rstrip("/") + "/" + target
+        if "/." in "/" + target:
+            path = posixpath.normpath(path)
+        return path
+
     def change_directory(self, current: str, target: str) -> str:
         """
         Cambia el directorio actual.
@@ -392,11 +524,7 @@ class FileSystem:
                 return "/" + "/".join(parts[:-1])
             return "/"
             
-        if target.startswith("/"):
-            new_path = target
-        else:
-            new_path = os.path.join(current, target)
-            
+        new_path = self.resolve_path(current, target)
         directory = self.get_item(new_path)
         if not isinstance(directory, Directory):
             raise ValueError(f"Directorio no encontrado: {target}")
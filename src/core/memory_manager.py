@@ -22,12 +22,16 @@ class MemoryBlock:
     """
     Representa un bloque de memoria en el sistema.
     
+    Los bloques forman una lista doblemente enlazada ordenada por dirección, de modo
+    que los vecinos de un bloque se alcanzan en O(1) al fusionar huecos libres.
+    
     Atributos:
         start_address: Dirección de inicio
         size: Tamaño del bloque
         is_allocated: Indica si el bloque está asignado
         process_id: ID del proceso que usa el bloque
         next_block: Referencia al siguiente bloque
+        prev_block: Referencia al bloque anterior
     
     Métodos:
         split: Divide el bloque en dos
@@ -41,14 +45,65 @@ class MemoryBlock:
         self.is_allocated = False
         self.process_id = None
         self.next_block = None
+        self.prev_block = None
+
+    def split(self, size):
+        """
+        Divide el bloque en dos: este conserva los primeros `size` bytes.
+        
+        Args:
+            size: Tamaño que conserva este bloque
+        
+        Returns:
+            MemoryBlock: Bloque con el resto, enlazado a continuación de este
+        """
+        remainder = MemoryBlock(self.start_address + size, self.size - size)
+        remainder.prev_block = self
+        remainder.next_block = self.next_block
+        if self.next_block is not None:
+            self.next_block.prev_block = remainder
+        self.next_block = remainder
+        self.size = size
+        return remainder
+
+    def merge(self):
+        """
+        Fusiona este bloque con el siguiente, que desaparece de la lista.
+        """
+        absorbed = self.next_block
+        self.size += absorbed.size
+        self.next_block = absorbed.next_block
+        if absorbed.next_block is not None:
+            absorbed.next_block.prev_block = self
+
+    def get_info(self):
+        """
+        Obtiene información del bloque.
+        
+        Returns:
+            dict: Dirección, tamaño, estado y proceso del bloque
+        """
+        return {
+            'start_address': self.start_address,
+            'size': self.size,
+            'is_allocated': self.is_allocated,
+            'process_id': self.process_id
+        }
 
 class MemoryManager:
     """
     Implementa el gestor de memoria del sistema operativo.
     
+    Los bloques libres se agrupan en listas segregadas por tamaño (una por potencia
+    de dos, índice = size.bit_length()), así que buscar hueco no recorre toda la
+    memoria; al liberar, los huecos vecinos se fusionan en O(1) con los enlaces
+    prev_block/next_block.
+    
     Atributos:
         total_memory: Memoria total disponible
-        memory_blocks: Lista de bloques de memoria
+        first_block: Primer bloque de la lista enlazada de bloques
+        free_buckets: Bloques libres por tamaño ({dirección: bloque} por cubeta)
+        process_blocks: Bloques asignados a cada proceso
         allocated_memory: Memoria asignada
         free_memory: Memoria libre
     
@@ -56,13 +111,121 @@ class MemoryManager:
         allocate: Asigna memoria a un proceso
         deallocate: Libera memoria de un proceso
         get_memory_info: Obtiene información de la memoria
-        defragment: Desfragmenta la memoria
         find_free_block: Busca un bloque libre
     """
     
     def __init__(self, total_memory=1024):
         self.total_memory = total_memory
-        self.memory_blocks = [MemoryBlock(0, total_memory)]
+        self.first_block = MemoryBlock(0, total_memory)
+        self.free_buckets = [{} for _ in range(total_memory.bit_length() + 1)]
+        self.process_blocks = {}
         self.allocated_memory = 0
         self.free_memory = total_memory
+        self._add_free_block(self.first_block)
+
+    def _add_free_block(self, block):
+        """Registra un bloque libre en la cubeta de su tamaño."""
+        self.free_buckets[block.size.bit_length()][block.start_address] = block
+
+    def _remove_free_block(self, block):
+        """Quita un bloque libre de la cubeta de su tamaño."""
+        del self.free_buckets[block.size.bit_length()][block.start_address]
+
+    def find_free_block(self, size):
+        """
+        Busca un bloque libre de al menos `size` bytes.
+        
+        Solo la cubeta de `size` puede contener bloques demasiado pequeños; en las
+        siguientes cualquier bloque sirve, así que basta con tomar el primero.
+        
+        Args:
+            size: Tamaño requerido
+        
+        Returns:
+            MemoryBlock: Bloque libre encontrado, o None si no hay hueco suficiente
+        """
+        bucket_index = size.bit_length()
+        for block in self.free_buckets[bucket_index].values():
+            if block.size >= size:
+                return block
+        for bucket in self.free_buckets[bucket_index + 1:]:
+            if bucket:
+                return next(iter(bucket.values()))
+        return None
+
+    def allocate(self, process_id, size):
+        """
+        Asigna memoria a un proceso.
+        
+        Args:
+            process_id: ID del proceso
+            size: Tamaño a asignar
+        
+        Returns:
+            int: Dirección de inicio del bloque asignado, o None si no hay memoria
+        """
+        if size <= 0 or size > self.free_memory:
+            return None
+        block = self.find_free_block(size)
+        if block is None:
+            return None
+        
+        self._remove_free_block(block)
+        if block.size > size:
+            self._add_free_block(block.split(size))
+        block.is_allocated = True
+        block.process_id = process_id
+        self.process_blocks.setdefault(process_id, []).append(block)
+        self.allocated_memory += size
+        self.free_memory -= size
+        return block.start_address
+
+    def deallocate(self, process_id):
+        """
+        Libera toda la memoria de un proceso, fusionando los huecos contiguos.
+        
+        Args:
+            process_id: ID del proceso
+        
+        Returns:
+            int: Cantidad de memoria liberada
+        """
+        freed = 0
+        for block in self.process_blocks.pop(process_id, []):
+            freed += block.size
+            block.is_allocated = False
+            block.process_id = None
+            
+            following = block.next_block
+            if following is not None and not following.is_allocated:
+                self._remove_free_block(following)
+                block.merge()
+            previous = block.prev_block
+            if previous is not None and not previous.is_allocated:
+                self._remove_free_block(previous)
+                previous.merge()
+                block = previous
+            self._add_free_block(block)
+        
+        self.allocated_memory -= freed
+        self.free_memory += freed
+        return freed
 
+    def get_memory_info(self):
+        """
+        Obtiene información de la memoria.
+        
+        Returns:
+            dict: Totales de memoria y lista de bloques en orden de dirección
+        """
+        blocks = []
+        block = self.first_block
+        while block is not None:
+            blocks.append(block.get_info())
+            block = block.next_block
+        return {
+            'total_memory': self.total_memory,
+            'allocated_memory': self.allocated_memory,
+            'free_memory': self.free_memory,
+            'blocks': blocks
+        }
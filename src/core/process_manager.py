@@ -16,12 +16,17 @@ Clases:
 --------
 - ProcessManager: Gestor principal de procesos
 - Process: Clase para representar procesos
+- ProcessInfo: Información de un proceso (tupla con nombre)
 """
 
+from collections import namedtuple
 from datetime import datetime
 import threading
 import time
 
+# Instantánea de un proceso; una tupla ocupa menos y se crea más rápido que un dict
+ProcessInfo = namedtuple('ProcessInfo', 'pid name state priority created_at cpu_time memory_usage')
+
 class Process:
     """
     Representa un proceso en el sistema operativo.
@@ -43,16 +48,31 @@ class Process:
         get_info: Obtiene información del proceso
     """
     
+    __slots__ = ('pid', 'name', 'state', 'priority', 'created_at', '_created_str',
+                 'cpu_time', 'memory_usage', 'thread')
+    
     def __init__(self, pid, name, priority=1):
         self.pid = pid
         self.name = name
         self.state = "ready"
         self.priority = priority
         self.created_at = datetime.now()
+        # La fecha no cambia: se formatea una vez y get_info reutiliza el texto
+        self._created_str = self.created_at.strftime("%Y-%m-%d %H:%M:%S")
         self.cpu_time = 0
         self.memory_usage = 0
         self.thread = None
 
+    def get_info(self):
+        """
+        Obtiene información del proceso.
+        
+        Returns:
+            ProcessInfo: PID, nombre, estado, prioridad, fecha de creación y recursos usados
+        """
+        return ProcessInfo(self.pid, self.name, self.state, self.priority,
+                           self._created_str, self.cpu_time, self.memory_usage)
+
 class ProcessManager:
     """
     Implementa el gestor de procesos del sistema operativo.
@@ -62,6 +82,7 @@ class ProcessManager:
         next_pid: Siguiente PID disponible
         running_process: Proceso actual en ejecución
         process_lock: Lock para sincronización
+        memory_manager: Gestor de memoria del que se libera la memoria de los procesos terminados
     
     Métodos:
         create_process: Crea un nuevo proceso
@@ -77,4 +98,68 @@ class ProcessManager:
         self.next_pid = 1
         self.running_process = None
         self.process_lock = threading.Lock()
+        self.memory_manager = None
+
+    def create_process(self, name, priority=1):
+        """
+        Crea un nuevo proceso.
+        
+        Args:
+            name: Nombre del proceso
+            priority: Prioridad del proceso
+        
+        Returns:
+            int: PID del proceso creado
+        """
+        with self.process_lock:
+            pid = self.next_pid
+            self.next_pid += 1
+            self.processes[pid] = Process(pid, name, priority)
+        return pid
+
+    def terminate_process(self, pid):
+        """
+        Termina un proceso y libera su memoria.
+        
+        Los procesos terminados salen del diccionario, así que listar los procesos
+        solo recorre los activos.
+        
+        Args:
+            pid: PID del proceso
+        
+        Returns:
+            bool: True si el proceso existía, False en caso contrario
+        """
+        with self.process_lock:
+            process = self.processes.pop(pid, None)
+            if process is None:
+                return False
+            if self.running_process is process:
+                self.running_process = None
+        process.state = "terminated"
+        if self.memory_manager is not None:
+            self.memory_manager.deallocate(pid)
+        return True
+
+    def list_processes(self):
+        """
+        Lista los procesos activos.
+        
+        Returns:
+            list: ProcessInfo de cada proceso, en orden de PID
+        """
+        return [process.get_info() for process in list(self.processes.values())]
+
+    def get_process_info(self, pid):
+        """
+        Obtiene información de un proceso.
+        
+        Args:
+            pid: PID del proceso
+        
+        Returns:
+            ProcessInfo: Información del proceso, o None si no existe
+        """
+        process = self.processes.get(pid)
+        return process.get_info() if process is not None else None
 
@@ -18,10 +18,106 @@ Clases:
 - User: Clase para representar usuarios
 """
 
+import atexit
+import base64
 import bcrypt
+import hashlib
 import json
+import os
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson  # Serializador JSON en C, opcional
+except ImportError:
+    orjson = None
+
+# Esquema de las contraseñas nuevas: bcrypt sobre el SHA-256 (en base64) de la contraseña.
+# Los registros sin este campo son hashes bcrypt directos de la contraseña.
+PASSWORD_SCHEME = "bcrypt-sha256"
+
+# Longitudes máximas de nombre de usuario y contraseña aceptadas por la interfaz.
+# Limitan el trabajo que un formulario puede pedir antes de llegar a bcrypt
+MAX_USERNAME_LEN = 32
+MAX_PASSWORD_LEN = 128
+
+# Tiempo mínimo entre escrituras de users.json por cambios que no urgen (último acceso)
+SAVE_DEBOUNCE_SECONDS = 5.0
+
+# Coste de bcrypt calibrado para esta máquina (se calcula la primera vez que se necesita)
+BCRYPT_COST = None
+
+# Hash de referencia para autenticar usuarios inexistentes (se genera la primera vez que se usa)
+_DUMMY_HASH = None
+
+def calibrate_bcrypt_cost(target_seconds=0.25, min_rounds=10, max_rounds=14):
+    """
+    Busca el coste de bcrypt cuyo hash tarda aproximadamente el tiempo objetivo.
+    
+    Args:
+        target_seconds: Tiempo objetivo por hash en segundos
+        min_rounds: Coste mínimo aceptado
+        max_rounds: Coste máximo aceptado
+    
+    Returns:
+        int: Coste (rounds) a usar en bcrypt.gensalt
+    """
+    rounds = min_rounds
+    while rounds < max_rounds:
+        start = time.perf_counter()
+        bcrypt.hashpw(b"calibracion", bcrypt.gensalt(rounds))
+        if time.perf_counter() - start >= target_seconds:
+            break
+        rounds += 1
+    return rounds
+
+def _get_bcrypt_cost():
+    """Obtiene el coste de bcrypt, calibrándolo una sola vez por proceso."""
+    global BCRYPT_COST
+    if BCRYPT_COST is None:
+        BCRYPT_COST = calibrate_bcrypt_cost()
+    return BCRYPT_COST
+
+def _prehash(password):
+    """
+    Reduce la contraseña a 44 bytes sin bytes nulos antes de pasarla a bcrypt,
+    que ignora lo que supere los 72 bytes.
+    
+    Args:
+        password: Contraseña en texto plano
+    
+    Returns:
+        bytes: SHA-256 de la contraseña codificado en base64
+    """
+    return base64.b64encode(hashlib.sha256(password.encode('utf-8')).digest())
+
+def _hash_password(password):
+    """
+    Calcula el hash de una contraseña con el esquema actual.
+    
+    Args:
+        password: Contraseña en texto plano
+    
+    Returns:
+        str: Hash bcrypt de la contraseña
+    """
+    return bcrypt.hashpw(_prehash(password), bcrypt.gensalt(_get_bcrypt_cost())).decode()
+
+def _get_dummy_hash():
+    """
+    Obtiene un hash bcrypt de una contraseña aleatoria, con el mismo coste que los reales.
+    
+    Returns:
+        bytes: Hash de referencia
+    """
+    global _DUMMY_HASH
+    if _DUMMY_HASH is None:
+        _DUMMY_HASH = _hash_password(secrets.token_hex(16)).encode()
+    return _DUMMY_HASH
+
 class User:
     """
     Representa un usuario en el sistema operativo.
@@ -42,7 +138,7 @@ class User:
     
     def __init__(self, username, password, role="user"):
         self.username = username
-        self.password_hash = bcrypt.hashpw(password.encode(), bcrypt.gensalt())
+        self.password_hash = _hash_password(password)
         self.role = role
         self.created_at = datetime.now()
         self.last_login = None
@@ -57,7 +153,8 @@ class User:
         """
         return {
             'username': self.username,
-            'password_hash': self.password_hash.decode(),
+            'password_hash': self.password_hash,
+            'password_scheme': PASSWORD_SCHEME,
             'role': self.role,
             'created_at': self.created_at.isoformat(),
             'last_login': self.last_login.isoformat() if self.last_login else None,
@@ -72,14 +169,22 @@ class UserManager:
         users: Diccionario de usuarios registrados
         current_user: Usuario actual
         users_file: Ruta al archivo de usuarios
+        _dirty: Hay cambios pendientes de guardar en disco
+        _last_flush: Momento (time.monotonic) de la última escritura
+        _save_lock: Serializa las escrituras de users.json
+        _save_seq: Número de la última instantánea de usuarios generada
+        _written_seq: Número de la última instantánea escrita en disco
+        _save_pool: Hilo que escribe users.json en los guardados asíncronos
     
     Métodos:
         create_user: Crea un nuevo usuario
         delete_user: Elimina un usuario
         authenticate: Autentica un usuario
+        start_session: Inicia la sesión de un usuario autenticado
         logout: Cierra la sesión
         get_user_info: Obtiene información de un usuario
         save_users: Guarda los usuarios en disco
+        save_users_async: Guarda los usuarios en disco desde un hilo aparte
         load_users: Carga los usuarios desde disco
     """
     
@@ -87,7 +192,16 @@ class UserManager:
         self.users = {}
         self.current_user = None
         self.users_file = "users.json"
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        self._save_lock = threading.Lock()
+        self._save_seq = 0
+        self._written_seq = 0
+        # Un único hilo: las escrituras se hacen en el orden en que se pidieron
+        self._save_pool = ThreadPoolExecutor(max_workers=1)
         self.load_users()
+        # Lo que quede pendiente se escribe al cerrar la aplicación
+        atexit.register(self._maybe_flush, True)
         
         # Crear usuario administrador por defecto si no existe ninguno
         if not self.users:
@@ -98,17 +212,80 @@ class UserManager:
         Carga los usuarios registrados desde el archivo de usuarios.
         """
         try:
-            with open(self.users_file, 'r') as f:
-                self.users = json.load(f)
+            if orjson is not None:
+                with open(self.users_file, 'rb') as f:
+                    self.users = orjson.loads(f.read())
+            else:
+                with open(self.users_file, 'r') as f:
+                    self.users = json.load(f)
         except FileNotFoundError:
             self.users = {}
 
     def save_users(self):
         """
         Guarda los usuarios registrados en el archivo de usuarios.
+        
+        Se escribe en un archivo temporal que luego reemplaza al original, para que
+        un cierre a mitad de escritura no deje users.json truncado.
+        """
+        self._write_users(*self._snapshot_users())
+
+    def save_users_async(self):
+        """
+        Guarda los usuarios sin bloquear al llamador.
+        
+        La serialización se hace aquí, así que los cambios posteriores no afectan a lo
+        guardado; solo la escritura en disco pasa a _save_pool. El intérprete espera a
+        que terminen las escrituras pendientes antes de salir.
         """
-        with open(self.users_file, 'w') as f:
-            json.dump(self.users, f)
+        self._save_pool.submit(self._write_users, *self._snapshot_users())
+
+    def _snapshot_users(self):
+        """
+        Serializa los usuarios y numera la instantánea.
+        
+        Returns:
+            tuple: Número de la instantánea y contenido del archivo en bytes
+        """
+        if orjson is not None:
+            data = orjson.dumps(self.users)
+        else:
+            data = json.dumps(self.users).encode()
+        self._save_seq += 1
+        self._dirty = False
+        self._last_flush = time.monotonic()
+        return self._save_seq, data
+
+    def _write_users(self, seq, data):
+        """
+        Escribe una instantánea en users.json, salvo que ya se haya escrito una más nueva.
+        
+        Args:
+            seq: Número de la instantánea
+            data: Contenido del archivo en bytes
+        """
+        with self._save_lock:
+            if seq <= self._written_seq:
+                return
+            tmp_file = self.users_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.users_file)
+            self._written_seq = seq
+
+    def _maybe_flush(self, force=False):
+        """
+        Guarda los cambios pendientes si ha pasado el intervalo mínimo entre escrituras.
+        
+        Args:
+            force: Guardar aunque no haya pasado el intervalo
+        """
+        if not self._dirty:
+            return
+        if force:
+            self.save_users()
+        elif time.monotonic() - self._last_flush > SAVE_DEBOUNCE_SECONDS:
+            self.save_users_async()
 
     def create_user(self, username, password, role="user"):
         """
@@ -125,7 +302,7 @@ class UserManager:
         if username in self.users:
             return False
         self.users[username] = User(username, password, role).to_dict()
-        self.save_users()
+        self.save_users_async()
         return True
 
     def delete_user(self, username):
@@ -155,10 +332,22 @@ class UserManager:
         Returns:
             bool: True si el usuario se autenticó correctamente, False en caso contrario
         """
-        if username not in self.users:
-            return False
-        stored_hash = self.users[username]['password_hash'].encode()
-        return bcrypt.checkpw(password.encode(), stored_hash)
+        # Se verifica siempre un hash bcrypt, aunque el usuario no exista, para que el
+        # tiempo de respuesta no permita distinguir usuarios inexistentes de contraseñas erróneas.
+        # El hash de referencia se obtiene en todos los casos: la primera vez se genera, y ese
+        # coste tampoco debe depender de que el usuario exista
+        dummy_hash = _get_dummy_hash()
+        user = self.users.get(username)
+        if user is None:
+            secret, stored_hash = _prehash(password), dummy_hash
+        else:
+            stored_hash = user['password_hash'].encode()
+            if user.get('password_scheme') == PASSWORD_SCHEME:
+                secret = _prehash(password)
+            else:
+                secret = password.encode()
+        password_ok = bcrypt.checkpw(secret, stored_hash)
+        return password_ok & (user is not None)
 
     def login(self, username, password):
         """
@@ -172,16 +361,28 @@ class UserManager:
             bool: True si el inicio de sesión fue exitoso, False en caso contrario
         """
         if self.authenticate(username, password):
-            self.current_user = username
-            self.users[username]['last_login'] = datetime.now().isoformat()
-            self.save_users()
+            self.start_session(username)
             return True
         return False
 
+    def start_session(self, username):
+        """
+        Inicia la sesión de un usuario ya autenticado.
+        
+        Args:
+            username: Nombre de usuario
+        """
+        self.current_user = username
+        self.users[username]['last_login'] = datetime.now().isoformat()
+        # El último acceso no justifica reescribir el archivo en cada inicio de sesión
+        self._dirty = True
+        self._maybe_flush()
+
     def logout(self):
         """
         Cierra la sesión del usuario actual.
         """
+        self._maybe_flush(force=True)
         self.current_user = None
 
     def get_user_info(self, username):
@@ -237,10 +438,21 @@ class UserManager:
         """
         if username not in self.users:
             return False
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.save_users()
         return True
 
+    def _set_password(self, username, new_password):
+        """
+        Guarda el hash de una nueva contraseña con el esquema actual.
+        
+        Args:
+            username: Nombre de usuario
+            new_password: Nueva contraseña del usuario
+        """
+        self.users[username]['password_hash'] = _hash_password(new_password)
+        self.users[username]['password_scheme'] = PASSWORD_SCHEME
+
     def update_role(self, username, new_role):
         """
         Actualiza el rol de un usuario registrado.
@@ -458,7 +670,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = True
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.save_users()
         return True
 
@@ -478,7 +690,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = False
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.save_users()
         return True
 
@@ -499,7 +711,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = True
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.save_users()
         return True
@@ -521,7 +733,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = False
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.save_users()
         return True
@@ -543,7 +755,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = True
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -566,7 +778,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = False
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -589,7 +801,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = True
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -612,7 +824,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = False
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -635,7 +847,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = True
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -658,7 +870,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = False
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -681,7 +893,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = True
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -704,7 +916,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = False
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -727,7 +939,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = True
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -750,7 +962,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = False
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
@@ -773,7 +985,7 @@ class UserManager:
         self.users[username]['created_at'] = datetime.now().isoformat()
         self.users[username]['is_active'] = True
         self.users[username]['last_login'] = datetime.now().isoformat()
-        self.users[username]['password_hash'] = bcrypt.hashpw(new_password.encode(), bcrypt.gensalt())
+        self._set_password(username, new_password)
         self.users[username]['role'] = new_role
         self.users[username]['username'] = username
         self.save_users()
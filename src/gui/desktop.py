@@ -22,22 +22,130 @@ Clases:
 
 # Importación de módulos de Qt para la interfaz gráfica
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                           QLabel, QPushButton, QMessageBox, QDesktopWidget,
+                           QGridLayout, QLabel, QPushButton, QMessageBox,
                            QFrame, QMenu, QAction, QScrollArea)
-from PyQt5.QtCore import Qt, QTimer, QSize, QPoint
-from PyQt5.QtGui import QPixmap, QIcon, QImage, QPainter
+from PyQt5.QtCore import Qt, QTimer, QSize, QPoint, QFile
+from PyQt5.QtGui import QPixmap, QIcon, QImage, QPixmapCache
 
 # Importación de módulos adicionales
 import cv2
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
 import os
 import sys
+import shutil
 import subprocess
 import pyttsx3
 
 # Importación de módulos locales
 from core.user_manager import UserManager
 from gui.terminal_window import TerminalWindow
+from gui.resources import ASSETS_DIR, asset_path, rounded_logo_pixmap
+from gui.screen import center_on_screen
+
+# Rutas de los recursos gráficos, resueltas una sola vez al importar el módulo
+LOGO_PATH = asset_path('logo.png')
+TERMINAL_ICON_PATH = asset_path('terminal.png')
+CALCULATOR_ICON_PATH = asset_path('calculator.png')
+EXPLORER_ICON_PATH = asset_path('explorer.png')
+# El video lo abre OpenCV y el fondo opcional no forma parte del recurso: siempre desde disco
+VIDEO_BACKGROUND_PATH = os.path.join(ASSETS_DIR, 'fondo.mp4')
+IMAGE_BACKGROUND_PATH = os.path.join(ASSETS_DIR, 'wallpaper.jpg')
+
+# Imagen de fondo decodificada, compartida por todos los escritorios (ver _get_background_pixmap)
+_BACKGROUND_PIXMAP = None
+# Número máximo de tamaños de fondo escalados que guarda cada escritorio
+_MAX_SCALED_BACKGROUNDS = 4
+
+# Ejecutables de las aplicaciones externas, resueltos una sola vez en el PATH
+_EXECUTABLES = {
+    name: shutil.which(name) or name
+    for name in ("calc.exe", "explorer.exe", "gnome-calculator", "nautilus")
+}
+
+@lru_cache(maxsize=None)
+def _asset_exists(path):
+    """
+    Comprueba si existe un recurso, consultando el disco solo la primera vez.
+    
+    Los recursos no cambian en tiempo de ejecución; todas las comprobaciones de
+    existencia del escritorio (logo, iconos y fondos) pasan por aquí.
+    
+    Args:
+        path: Ruta del recurso
+    
+    Returns:
+        bool: True si el recurso existe
+    """
+    return QFile.exists(path)
+
+def _get_background_pixmap():
+    """
+    Obtiene la imagen de fondo, decodificándola solo la primera vez.
+    
+    QPixmap se comparte implícitamente, así que todas las ventanas usan los mismos datos.
+    
+    Returns:
+        QPixmap: Imagen de fondo (nula si no se pudo cargar)
+    """
+    global _BACKGROUND_PIXMAP
+    if _BACKGROUND_PIXMAP is None:
+        _BACKGROUND_PIXMAP = QPixmap(IMAGE_BACKGROUND_PATH)
+    return _BACKGROUND_PIXMAP
+
+def prewarm_assets():
+    """
+    Carga por adelantado los recursos gráficos del escritorio, sin crear widgets.
+    
+    Deja en caché el logo, los iconos y, si no hay video, la imagen de fondo, para que
+    construir el escritorio después no tenga que decodificarlos. Es un generador que
+    se detiene tras cada imagen, así quien lo recorre puede devolver el control al
+    bucle de eventos entre una y otra.
+    """
+    if _asset_exists(LOGO_PATH):
+        rounded_logo_pixmap()
+        yield
+        DesktopIcon.load_icon_pixmap(LOGO_PATH, 32)
+        yield
+    for icon_path in (TERMINAL_ICON_PATH, CALCULATOR_ICON_PATH, EXPLORER_ICON_PATH):
+        if _asset_exists(icon_path):
+            DesktopIcon.load_icon_pixmap(icon_path)
+            yield
+    if not _asset_exists(VIDEO_BACKGROUND_PATH) and _asset_exists(IMAGE_BACKGROUND_PATH):
+        _get_background_pixmap()
+        yield
+
+def launch_app(command):
+    """
+    Lanza una aplicación externa sin un shell intermedio y desligada del escritorio.
+    
+    Args:
+        command: Lista con el ejecutable y sus argumentos
+    
+    Returns:
+        subprocess.Popen: Proceso lanzado
+    """
+    args = [_EXECUTABLES.get(command[0], command[0])] + list(command[1:])
+    if os.name == 'nt':  # Windows
+        return subprocess.Popen(args, close_fds=True,
+                                creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+    return subprocess.Popen(args, close_fds=True, start_new_session=True)
+
+# Estilo común de los menús emergentes del menú de inicio
+_MENU_QSS = """
+    QMenu {
+        background-color: rgba(0, 0, 0, 0.9);
+        border: 1px solid rgba(255, 255, 255, 0.1);
+    }
+    QMenu::item {
+        color: white;
+        padding: 5px 20px;
+    }
+    QMenu::item:selected {
+        background-color: rgba(255, 255, 255, 0.1);
+    }
+"""
 
 class StartMenu(QFrame):
     def __init__(self, parent=None):
@@ -47,6 +155,12 @@ class StartMenu(QFrame):
         self.setMinimumHeight(400)
         self.setMaximumHeight(600)
         
+        # Logo original (sin escalar) y timer para el reescalado suave diferido
+        self._logo_pixmap = None
+        self._logo_timer = QTimer(self)
+        self._logo_timer.setSingleShot(True)
+        self._logo_timer.timeout.connect(self.update_logo_size)
+        
         self.setStyleSheet("""
             QFrame {
                 background-color: rgba(40, 40, 40, 0.4);
@@ -97,6 +211,10 @@ class StartMenu(QFrame):
         """)
         
         self.setup_ui()
+        
+        # Menús emergentes construidos una sola vez y reutilizados en cada clic
+        self._user_menu = self._build_menu([("Cerrar Sesión", self.logout)])
+        self._power_menu = self._build_menu([("Apagar", self.shutdown_system)])
         self.hide()
 
     def setup_ui(self):
@@ -138,35 +256,11 @@ class StartMenu(QFrame):
     def setup_logo(self, layout):
         logo_label = QLabel()
         logo_label.setObjectName("logoLabel")
-        logo_path = os.path.join(os.path.dirname(__file__), 'assets', 'logo.png')
-        if os.path.exists(logo_path):
-            original_pixmap = QPixmap(logo_path)
-            rounded_pixmap = self.create_rounded_pixmap(original_pixmap)
-            logo_label.setPixmap(rounded_pixmap.scaled(280, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        if _asset_exists(LOGO_PATH):
+            self._logo_pixmap = rounded_logo_pixmap()
+            logo_label.setPixmap(self._logo_pixmap.scaled(280, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation))
         layout.addWidget(logo_label)
 
-    def create_rounded_pixmap(self, original_pixmap):
-        mask = QPixmap(original_pixmap.size())
-        mask.fill(Qt.transparent)
-        painter = QPainter(mask)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(Qt.black)
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(0, 0, mask.width(), mask.height(), 50, 50)
-        painter.end()
-        
-        rounded_pixmap = QPixmap(original_pixmap.size())
-        rounded_pixmap.fill(Qt.transparent)
-        painter = QPainter(rounded_pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setCompositionMode(QPainter.CompositionMode_Source)
-        painter.drawPixmap(0, 0, original_pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
-        painter.drawPixmap(0, 0, mask)
-        painter.end()
-        
-        return rounded_pixmap
-
     def add_separator(self, layout):
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
@@ -205,49 +299,29 @@ class StartMenu(QFrame):
         terminal.show()
         self.hide()
 
-    def show_user_menu(self):
-        menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: rgba(0, 0, 0, 0.9);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-            QMenu::item {
-                color: white;
-                padding: 5px 20px;
-            }
-            QMenu::item:selected {
-                background-color: rgba(255, 255, 255, 0.1);
-            }
-        """)
+    def _build_menu(self, actions):
+        """
+        Construye un menú emergente con el estilo común del menú de inicio.
         
-        logout = QAction("Cerrar Sesión", self)
-        logout.triggered.connect(self.logout)
-        menu.addAction(logout)
+        Args:
+            actions: Lista de tuplas (texto, función) con las acciones del menú
         
-        menu.exec_(self.mapToGlobal(QPoint(0, self.height() - 50)))
+        Returns:
+            QMenu: Menú construido
+        """
+        menu = QMenu(self)
+        menu.setStyleSheet(_MENU_QSS)
+        for text, slot in actions:
+            action = QAction(text, self)
+            action.triggered.connect(slot)
+            menu.addAction(action)
+        return menu
+
+    def show_user_menu(self):
+        self._user_menu.exec_(self.mapToGlobal(QPoint(0, self.height() - 50)))
 
     def show_power_menu(self):
-        menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: rgba(0, 0, 0, 0.9);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }
-            QMenu::item {
-                color: white;
-                padding: 5px 20px;
-            }
-            QMenu::item:selected {
-                background-color: rgba(255, 255, 255, 0.1);
-            }
-        """)
-        
-        shutdown = QAction("Apagar", self)
-        shutdown.triggered.connect(self.shutdown_system)
-        menu.addAction(shutdown)
-        
-        menu.exec_(self.mapToGlobal(QPoint(0, self.height() - 50)))
+        self._power_menu.exec_(self.mapToGlobal(QPoint(0, self.height() - 50)))
 
     def logout(self):
         reply = QMessageBox.question(self, 'Cerrar Sesión',
@@ -266,51 +340,56 @@ class StartMenu(QFrame):
     def resizeEvent(self, event):
         """Maneja el redimensionamiento del menú de inicio."""
         super().resizeEvent(event)
-        self.update_logo_size()
+        if event.size() == event.oldSize():
+            return
+        # Escalado rápido mientras dura el redimensionamiento; el suave se aplica al terminar
+        self.update_logo_size(Qt.FastTransformation)
+        self._logo_timer.start(150)
 
-    def update_logo_size(self):
+    def update_logo_size(self, transformation=Qt.SmoothTransformation):
         """Actualiza el tamaño del logo cuando se redimensiona el menú."""
         logo_label = self.findChild(QLabel, "logoLabel")
-        if logo_label and logo_label.pixmap():
+        if logo_label and self._logo_pixmap is not None:
             new_width = self.width() - 20
             new_height = int(new_width * 0.357)
-            logo_label.setPixmap(logo_label.pixmap().scaled(
+            logo_label.setPixmap(self._logo_pixmap.scaled(
                 new_width, new_height,
                 Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
+                transformation
             ))
 
     def run_app(self, command):
         try:
-            if os.name == 'nt':  # Windows
-                if command[0] == "calc.exe":
-                    subprocess.Popen(["calc.exe"], shell=True)
-                elif command[0] == "explorer.exe":
-                    subprocess.Popen(["explorer.exe"], shell=True)
-            else:  # Linux/Unix
-                subprocess.Popen(command)
+            launch_app(command)
             self.hide()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"No se pudo ejecutar la aplicación: {str(e)}")
 
 class DesktopIcon(QWidget):
+    # Hoja de estilo compartida por todos los iconos; Qt aplica :hover por sí mismo,
+    # así que se asigna una sola vez y no se vuelve a analizar al pasar el cursor
+    STYLE = """
+        QWidget {
+            background-color: transparent;
+            border: none;
+        }
+        QLabel {
+            color: white;
+            background-color: transparent;
+        }
+        DesktopIcon:hover {
+            background-color: rgba(255, 255, 255, 0.1);
+            border-radius: 5px;
+        }
+    """
+
     def __init__(self, name, icon_path, command, parent=None):
         super().__init__(parent)
         self.setFixedSize(80, 100)
-        self.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border: none;
-            }
-            QLabel {
-                color: white;
-                background-color: transparent;
-            }
-            QWidget:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 5px;
-            }
-        """)
+        # Sin este atributo un QWidget propio no pinta el fondo de su hoja de estilo
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet(self.STYLE)
+        self.build_layout()
         
         self.name = name
         self.icon_path = icon_path
@@ -337,40 +416,52 @@ class DesktopIcon(QWidget):
         self.speech_timer.timeout.connect(self.speak_text)
         self.current_text = ""
 
-    def setup_ui(self, name, icon_path, command):
+    def build_layout(self):
+        """Crea la estructura fija del icono: imagen arriba y nombre debajo."""
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
         layout.setAlignment(Qt.AlignCenter)
         
         # Icono
-        icon_label = QLabel()
-        if os.path.exists(icon_path):
-            icon = QIcon(icon_path)
-            pixmap = icon.pixmap(QSize(48, 48))
-            icon_label.setPixmap(pixmap)
-        icon_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(icon_label)
+        self.icon_label = QLabel()
+        self.icon_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.icon_label)
         
         # Texto
-        text_label = QLabel(name)
-        text_label.setAlignment(Qt.AlignCenter)
-        text_label.setWordWrap(True)
-        text_label.setStyleSheet("color: white;")
-        layout.addWidget(text_label)
+        self.text_label = QLabel()
+        self.text_label.setAlignment(Qt.AlignCenter)
+        self.text_label.setWordWrap(True)
+        layout.addWidget(self.text_label)
+
+    def setup_ui(self, name, icon_path, command):
+        if _asset_exists(icon_path):
+            self.icon_label.setPixmap(self.load_icon_pixmap(icon_path))
+        self.text_label.setText(name)
         
         self.mousePressEvent = self.on_click
 
+    @staticmethod
+    def load_icon_pixmap(icon_path, size=48):
+        """Obtiene el pixmap del icono desde la caché compartida, rasterizándolo solo la primera vez."""
+        key = f"{icon_path}@{size}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QIcon(icon_path).pixmap(QSize(size, size))
+            QPixmapCache.insert(key, pixmap)
+        return pixmap
+
     def on_click(self, event):
         try:
             if self.command[0] == "terminal":
-                if not hasattr(self.parent(), 'user_manager'):
+                desktop = self.window()
+                if not hasattr(desktop, 'user_manager'):
                     QMessageBox.critical(self, "Error", "No se pudo acceder al gestor de usuarios")
                     return
-                terminal = TerminalWindow(self.parent().user_manager, self.parent())
+                terminal = TerminalWindow(desktop.user_manager, desktop)
                 terminal.show()
             else:
-                subprocess.Popen(self.command)
+                launch_app(self.command)
         except Exception as e:
             QMessageBox.critical(self, "Error", f"No se pudo ejecutar la aplicación: {str(e)}")
 
@@ -392,17 +483,6 @@ class DesktopIcon(QWidget):
             print(f"Error al reproducir texto: {str(e)}")
     
     def enterEvent(self, event):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 5px;
-            }
-            QLabel {
-                color: white;
-                background-color: transparent;
-            }
-        """)
-        
         if self.command[0] == "terminal":
             self.current_text = f"Terminal del sistema."
         elif self.command[0] == "calc.exe":
@@ -415,31 +495,27 @@ class DesktopIcon(QWidget):
         self.speech_timer.start(100)
         super().enterEvent(event)
 
-    def leaveEvent(self, event):
-        self.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border: none;
-            }
-            QLabel {
-                color: white;
-                background-color: transparent;
-            }
-            QWidget:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 5px;
-            }
-        """)
-        super().leaveEvent(event)
-
 class Desktop(QMainWindow):
     def __init__(self, user_manager, parent=None):
         super().__init__(parent)
         self.user_manager = user_manager
         self.background_label = None
         self.video_capture = None
+        self.video_timer = None
+        self.background_pixmap = None
+        # Fondos ya escalados por (ancho, alto, densidad de píxeles), del menos al más reciente
+        self._scaled_backgrounds = OrderedDict()
         self.start_menu = None
         self.desktop_icons = []
+        # Últimos valores mostrados en el reloj, para no repintar si no cambian
+        self._last_time = ""
+        self._last_date = ""
+        # Caché de pixmaps compartida por todos los iconos del escritorio (en KB)
+        QPixmapCache.setCacheLimit(10240)
+        # Timer para aplicar el escalado suave del fondo al terminar de redimensionar
+        self._background_timer = QTimer(self)
+        self._background_timer.setSingleShot(True)
+        self._background_timer.timeout.connect(self.update_background_pixmap)
         self.init_ui()
         
         self.timer = QTimer(self)
@@ -477,20 +553,18 @@ class Desktop(QMainWindow):
         self.background_label = QLabel()
         self.background_label.setStyleSheet("background-color: #1a1a1a;")
         
-        background_path = os.path.join(os.path.dirname(__file__), 'assets', 'fondo.mp4')
-        image_path = os.path.join(os.path.dirname(__file__), 'assets', 'wallpaper.jpg')
-        
-        if os.path.exists(background_path):
+        if _asset_exists(VIDEO_BACKGROUND_PATH):
             try:
-                self.setup_video_background(background_path)
+                self.setup_video_background(VIDEO_BACKGROUND_PATH)
             except Exception as e:
                 print(f"Error al configurar el video de fondo: {e}")
                 self.background_label.setStyleSheet("background-color: #1a1a1a;")
-        elif os.path.exists(image_path):
+        elif _asset_exists(IMAGE_BACKGROUND_PATH):
             try:
-                pixmap = QPixmap(image_path)
+                pixmap = _get_background_pixmap()
                 if not pixmap.isNull():
-                    self.background_label.setPixmap(pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding))
+                    self.background_pixmap = pixmap
+                    self.update_background_pixmap()
                 else:
                     print("Error: No se pudo cargar la imagen de fondo")
                     self.background_label.setStyleSheet("background-color: #1a1a1a;")
@@ -530,10 +604,9 @@ class Desktop(QMainWindow):
         
         # Botón de inicio
         start_button = QPushButton()
-        logo_path = os.path.join(os.path.dirname(__file__), 'assets', 'logo.png')
-        if os.path.exists(logo_path):
-            pixmap = QPixmap(logo_path)
-            start_button.setIcon(QIcon(pixmap.scaled(32, 32, Qt.KeepAspectRatio, Qt.SmoothTransformation)))
+        if _asset_exists(LOGO_PATH):
+            # Misma caché de pixmaps que los iconos del escritorio: el logo se decodifica una vez
+            start_button.setIcon(QIcon(DesktopIcon.load_icon_pixmap(LOGO_PATH, 32)))
         start_button.setIconSize(QSize(32, 32))
         start_button.clicked.connect(self.toggle_start_menu)
         taskbar_layout.addWidget(start_button)
@@ -558,9 +631,12 @@ class Desktop(QMainWindow):
             if not self.video_capture.isOpened():
                 raise Exception("No se pudo abrir el video")
 
+            # El timer arranca al mostrarse la ventana (showEvent), no antes
             self.video_timer = QTimer(self)
+            self.video_timer.setInterval(30)
             self.video_timer.timeout.connect(self.update_video_frame)
-            self.video_timer.start(30)
+            if self.isVisible():
+                self.video_timer.start()
             print("Video de fondo iniciado correctamente")
         except Exception as e:
             print(f"Error al configurar el video de fondo: {e}")
@@ -568,6 +644,18 @@ class Desktop(QMainWindow):
                 self.video_capture.release()
             self.background_label.setStyleSheet("background-color: #1a1a1a;")
 
+    def showEvent(self, event):
+        """Reanuda el video de fondo al mostrarse la ventana."""
+        super().showEvent(event)
+        if self.video_timer is not None:
+            self.video_timer.start()
+
+    def hideEvent(self, event):
+        """Detiene el video de fondo mientras la ventana está oculta."""
+        super().hideEvent(event)
+        if self.video_timer is not None:
+            self.video_timer.stop()
+
     def update_video_frame(self):
         if self.video_capture and self.video_capture.isOpened():
             ret, frame = self.video_capture.read()
@@ -586,30 +674,36 @@ class Desktop(QMainWindow):
         apps = [
             {
                 "name": "Terminal",
-                "icon": os.path.join(os.path.dirname(__file__), 'assets', 'terminal.png'),
+                "icon": TERMINAL_ICON_PATH,
                 "command": ["terminal"]
             },
             {
                 "name": "Calculadora",
-                "icon": os.path.join(os.path.dirname(__file__), 'assets', 'calculator.png'),
+                "icon": CALCULATOR_ICON_PATH,
                 "command": ["calc.exe"] if os.name == 'nt' else ["gnome-calculator"]
             },
             {
                 "name": "Explorador",
-                "icon": os.path.join(os.path.dirname(__file__), 'assets', 'explorer.png'),
+                "icon": EXPLORER_ICON_PATH,
                 "command": ["explorer.exe"] if os.name == 'nt' else ["nautilus"]
             }
         ]
         
+        # Contenedor transparente sobre el fondo; Qt posiciona los iconos en la cuadrícula
+        self.icon_container = QWidget(self)
+        self.icon_grid = QGridLayout(self.icon_container)
+        self.icon_grid.setContentsMargins(20, 20, 20, 20)
+        self.icon_grid.setSpacing(20)
+        self.icon_grid.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+        
+        self._icon_columns = 4
         for i, app in enumerate(apps):
-            icon = DesktopIcon(app["name"], app["icon"], app["command"], self)
-            row = i // 4
-            col = i % 4
-            x = 20 + (col * 100)
-            y = 20 + (row * 120)
-            icon.move(x, y)
-            icon.show()
+            icon = DesktopIcon(app["name"], app["icon"], app["command"], self.icon_container)
+            self.icon_grid.addWidget(icon, i // self._icon_columns, i % self._icon_columns)
             self.desktop_icons.append(icon)
+        
+        self.icon_container.adjustSize()
+        self.icon_container.raise_()
 
     def toggle_start_menu(self):
         if self.start_menu.isVisible():
@@ -627,32 +721,39 @@ class Desktop(QMainWindow):
         super().mousePressEvent(event)
 
     def center(self):
-        frame_geometry = self.frameGeometry()
-        screen_center = QDesktopWidget().availableGeometry().center()
-        frame_geometry.moveCenter(screen_center)
-        self.move(frame_geometry.topLeft())
+        center_on_screen(self)
 
     def update_time(self):
-        current_time = datetime.now().strftime("%H:%M:%S")
-        current_date = datetime.now().strftime("%d/%m/%Y")
+        """Actualiza la hora cada segundo y la fecha solo cuando cambia el minuto."""
+        now = datetime.now()
+        # Un único datetime.now() por tick; formateo directo sin strftime
+        current_time = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+        if current_time == self._last_time:
+            return
+        minute_changed = current_time[:5] != self._last_time[:5]
+        self._last_time = current_time
         if hasattr(self, 'time_label'):
             self.time_label.setText(current_time)
-        if hasattr(self, 'date_label'):
-            self.date_label.setText(current_date)
+        
+        if minute_changed or not self._last_date:
+            current_date = f"{now.day:02d}/{now.month:02d}/{now.year}"
+            if current_date != self._last_date and hasattr(self, 'date_label'):
+                self.date_label.setText(current_date)
+                self._last_date = current_date
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
+        if event.size() == event.oldSize():
+            return
         self.background_label.setFixedSize(self.size())
         
         if self.video_capture and self.video_capture.isOpened():
             self.update_video_frame()
         
-        if self.background_label.pixmap():
-            self.background_label.setPixmap(
-                self.background_label.pixmap().scaled(
-                    self.size(), Qt.KeepAspectRatioByExpanding
-                )
-            )
+        if self.background_pixmap is not None:
+            # Escalado rápido mientras dura el redimensionamiento; el suave se aplica al terminar
+            self.update_background_pixmap(Qt.FastTransformation)
+            self._background_timer.start(150)
         
         if self.start_menu and self.start_menu.isVisible():
             pos = self.mapToGlobal(QPoint(0, self.height() - self.start_menu.height() - 80))
@@ -660,22 +761,39 @@ class Desktop(QMainWindow):
         
         self.reposition_desktop_icons()
 
+    def update_background_pixmap(self, transformation=Qt.SmoothTransformation):
+        """Escala la imagen de fondo original al tamaño actual de la ventana."""
+        if self.background_pixmap is None:
+            return
+        ratio = self.devicePixelRatioF()
+        key = (self.width(), self.height(), ratio)
+        scaled = self._scaled_backgrounds.get(key)
+        if scaled is None:
+            scaled = self.background_pixmap.scaled(
+                int(self.width() * ratio), int(self.height() * ratio),
+                Qt.KeepAspectRatioByExpanding, transformation
+            )
+            scaled.setDevicePixelRatio(ratio)
+            # Solo se guardan los escalados suaves; los rápidos son provisionales
+            if transformation == Qt.SmoothTransformation:
+                self._scaled_backgrounds[key] = scaled
+                if len(self._scaled_backgrounds) > _MAX_SCALED_BACKGROUNDS:
+                    self._scaled_backgrounds.popitem(last=False)
+        else:
+            self._scaled_backgrounds.move_to_end(key)
+        self.background_label.setPixmap(scaled)
+
     def reposition_desktop_icons(self):
-        """Reposiciona los iconos del escritorio cuando se redimensiona la ventana."""
+        """Redistribuye la cuadrícula de iconos cuando cambia el número de columnas que caben."""
         if not self.desktop_icons:
             return
-            
-        # Calcular el número de columnas basado en el ancho de la ventana
-        icon_width = 100
-        icon_height = 120
-        margin = 20
-        
-        # Calcular el número máximo de columnas que caben en la ventana
-        max_columns = max(1, (self.width() - margin) // icon_width)
-        
-        for i, icon in enumerate(self.desktop_icons):
-            row = i // max_columns
-            col = i % max_columns
-            x = margin + (col * icon_width)
-            y = margin + (row * icon_height)
-            icon.move(x, y) 
\ No newline at end of file
+        
+        # Cada icono ocupa 80 px más 20 px de separación, dentro de un margen de 20 px
+        max_columns = max(1, (self.width() - 20) // 100)
+        if max_columns != self._icon_columns:
+            self._icon_columns = max_columns
+            for icon in self.desktop_icons:
+                self.icon_grid.removeWidget(icon)
+            for i, icon in enumerate(self.desktop_icons):
+                self.icon_grid.addWidget(icon, i // max_columns, i % max_columns)
+        self.icon_container.adjustSize()
@@ -15,15 +15,68 @@ incluyendo:
 Clases:
 --------
 - LoginWindow: Ventana de inicio de sesión
+- LoginWorker: Tarea que verifica las credenciales fuera del hilo de la interfaz
 """
 
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-                           QLabel, QLineEdit, QPushButton, QMessageBox,
-                           QDesktopWidget, QFrame)
-from PyQt5.QtCore import Qt, QSize, QTimer
-from PyQt5.QtGui import QPixmap, QIcon, QFont, QPainter, QColor
-import os
-from gui.desktop import Desktop
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QLabel,
+                           QLineEdit, QPushButton, QMessageBox, QStackedWidget)
+from PyQt5.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, pyqtSignal
+import math
+import time
+from core.user_manager import MAX_USERNAME_LEN, MAX_PASSWORD_LEN
+from gui.resources import rounded_logo_pixmap
+from gui.screen import center_on_screen
+
+# Espera desde que se muestra el formulario hasta precargar los recursos del escritorio
+_PREWARM_DELAY_MS = 500
+
+# Intentos fallidos que se permiten a cada usuario antes de empezar a bloquearlo
+_FREE_ATTEMPTS = 3
+
+# Páginas del widget central de LoginWindow
+_FORM_PAGE = 0
+_LOCKED_PAGE = 1
+
+class LoginSignals(QObject):
+    """
+    Señales emitidas por LoginWorker.
+    
+    Señales:
+        finished: Resultado de la verificación (True si las credenciales son válidas)
+        error: Mensaje de error si la verificación falló
+    """
+    finished = pyqtSignal(bool)
+    error = pyqtSignal(str)
+
+class LoginWorker(QRunnable):
+    """
+    Verifica las credenciales en un hilo del QThreadPool.
+    
+    bcrypt libera el GIL mientras calcula el hash, así que la interfaz sigue
+    respondiendo. La tarea no toca ningún widget: solo emite señales.
+    
+    Atributos:
+        user_manager: Gestor de usuarios del sistema
+        username: Nombre de usuario
+        password: Contraseña introducida
+        signals: Señales con el resultado
+    """
+    
+    def __init__(self, user_manager, username, password):
+        super().__init__()
+        self.user_manager = user_manager
+        self.username = username
+        self.password = password
+        self.signals = LoginSignals()
+
+    def run(self):
+        """Ejecuta la verificación y emite el resultado."""
+        try:
+            ok = self.user_manager.authenticate(self.username, self.password)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(ok)
 
 class LoginWindow(QMainWindow):
     """
@@ -38,19 +91,30 @@ class LoginWindow(QMainWindow):
         password_input: Campo de entrada para la contraseña
         login_button: Botón de inicio de sesión
         status_label: Etiqueta de estado
-        login_attempts: Contador de intentos de inicio de sesión
-        lockout_timer: Timer para el bloqueo temporal
+        locked_label: Etiqueta de la página de bloqueo
+        desktop: Escritorio abierto tras iniciar sesión
     """
     
+    # Logo redondeado y escalado, compartido por todas las ventanas de inicio de sesión
+    _LOGO_CACHE = None
+    
+    # Estado del bloqueo por usuario, compartido por todas las ventanas: cerrar sesión
+    # y volver a la pantalla de inicio no reinicia los intentos ni el bloqueo
+    login_attempts = {}   # Intentos fallidos consecutivos por nombre de usuario
+    _lockout_until = {}   # Instante (time.monotonic) en que termina el bloqueo de cada usuario
+    
     def __init__(self, user_manager, file_system, process_manager, memory_manager):
         super().__init__()
         self.user_manager = user_manager
         self.file_system = file_system
         self.process_manager = process_manager
         self.memory_manager = memory_manager
-        self.login_attempts = 0
-        self.lockout_timer = QTimer()
-        self.lockout_timer.timeout.connect(self.reset_login_attempts)
+        self.desktop = None
+        self._form_built = False
+        self._login_signals = None
+        # Cuadro de mensajes reutilizado por show_error y show_warning
+        self._error_box = QMessageBox(self)
+        self._error_box.setWindowTitle("Error")
         self.init_ui()
         self.center()
 
@@ -58,100 +122,79 @@ class LoginWindow(QMainWindow):
         """Inicializa la interfaz de usuario."""
         self.setWindowTitle('SistemaJuanchOS - Login')
         self.setFixedSize(400, 500)
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: transparent;
-            }
-            QWidget#centralWidget {
-                background-color: rgba(40, 40, 40, 0.4);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 10px;
-            }
-            QLabel {
-                color: white;
-                font-size: 14px;
-                background-color: transparent;
-            }
-            QLineEdit {
-                padding: 10px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 5px;
-                background-color: rgba(60, 60, 60, 0.4);
-                color: white;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                background-color: rgba(80, 80, 80, 0.4);
-            }
-            QPushButton {
-                padding: 10px;
-                background-color: rgba(0, 123, 255, 0.4);
-                color: white;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(0, 123, 255, 0.6);
-            }
-            QPushButton:disabled {
-                background-color: rgba(102, 102, 102, 0.4);
-                color: rgba(153, 153, 153, 0.8);
-            }
-        """)
-        
-        # Widget central
-        central_widget = QWidget()
-        central_widget.setObjectName("centralWidget")
-        self.setCentralWidget(central_widget)
-        layout = QVBoxLayout(central_widget)
+        # El estilo se define en assets/login.qss y se aplica una sola vez a toda la
+        # aplicación al arrancar (ver main.py); aquí solo se identifica la ventana
+        self.setObjectName("loginWindow")
+        
+        # Widget central: una página por estado (formulario y bloqueo), se alterna sin reconstruir
+        self._stack = QStackedWidget()
+        self._stack.setObjectName("centralWidget")
+        self.setCentralWidget(self._stack)
+        
+        form_page = QWidget()
+        layout = QVBoxLayout(form_page)
         layout.setContentsMargins(40, 40, 40, 40)
         layout.setSpacing(20)
         
         # Logo
         self.setup_logo(layout)
         
-        # Formulario de login
-        self.setup_login_form(layout)
+        # El formulario y el botón se construyen al mostrarse la ventana (showEvent)
+        self._form_layout = layout
+        self._stack.addWidget(form_page)
+        self._stack.addWidget(self.build_locked_page())
+
+    def build_locked_page(self):
+        """
+        Construye la página que se muestra durante el bloqueo temporal.
+        
+        Returns:
+            QWidget: Página de bloqueo
+        """
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(40, 40, 40, 40)
+        layout.setSpacing(20)
+        layout.addStretch()
         
-        # Botón de inicio de sesión
-        self.setup_login_button(layout)
+        self.locked_label = QLabel()
+        self.locked_label.setAlignment(Qt.AlignCenter)
+        self.locked_label.setWordWrap(True)
+        layout.addWidget(self.locked_label)
+        
+        back_button = QPushButton("Volver")
+        back_button.clicked.connect(lambda: self._stack.setCurrentIndex(_FORM_PAGE))
+        layout.addWidget(back_button)
+        layout.addStretch()
+        return page
+
+    def showEvent(self, event):
+        """Construye el formulario la primera vez que se muestra la ventana."""
+        if not self._form_built:
+            self.setup_login_form(self._form_layout)
+            # Con el formulario ya visible y usable, mientras se escribe, se precargan
+            # el módulo y las imágenes del escritorio (sin crear sus widgets)
+            QTimer.singleShot(_PREWARM_DELAY_MS, self._prewarm_desktop)
+        super().showEvent(event)
 
     def setup_logo(self, layout):
         """Configura el logo de la aplicación."""
         logo_label = QLabel()
-        logo_path = os.path.join(os.path.dirname(__file__), 'assets', 'logo.png')
-        if os.path.exists(logo_path):
-            original_pixmap = QPixmap(logo_path)
-            rounded_pixmap = self.create_rounded_pixmap(original_pixmap)
-            logo_label.setPixmap(rounded_pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        if LoginWindow._LOGO_CACHE is None:
+            # Sin comprobar antes el disco: si el recurso no existe el pixmap queda nulo
+            rounded_pixmap = rounded_logo_pixmap()
+            if not rounded_pixmap.isNull():
+                # Se escala a la densidad de píxeles de la pantalla para que se vea nítido
+                ratio = self.devicePixelRatioF()
+                size = int(200 * ratio)
+                scaled_pixmap = rounded_pixmap.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                scaled_pixmap.setDevicePixelRatio(ratio)
+                LoginWindow._LOGO_CACHE = scaled_pixmap
+        if LoginWindow._LOGO_CACHE is not None:
+            logo_label.setPixmap(LoginWindow._LOGO_CACHE)
         logo_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(logo_label)
 
-    def create_rounded_pixmap(self, original_pixmap):
-        mask = QPixmap(original_pixmap.size())
-        mask.fill(Qt.transparent)
-        painter = QPainter(mask)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setBrush(Qt.black)
-        painter.setPen(Qt.NoPen)
-        painter.drawRoundedRect(0, 0, mask.width(), mask.height(), 50, 50)
-        painter.end()
-        
-        rounded_pixmap = QPixmap(original_pixmap.size())
-        rounded_pixmap.fill(Qt.transparent)
-        painter = QPainter(rounded_pixmap)
-        painter.setRenderHint(QPainter.Antialiasing)
-        painter.setCompositionMode(QPainter.CompositionMode_Source)
-        painter.drawPixmap(0, 0, original_pixmap)
-        painter.setCompositionMode(QPainter.CompositionMode_DestinationIn)
-        painter.drawPixmap(0, 0, mask)
-        painter.end()
-        
-        return rounded_pixmap
-
     def setup_login_form(self, layout):
         """
         Configura el formulario de inicio de sesión.
@@ -159,22 +202,43 @@ class LoginWindow(QMainWindow):
         Args:
             layout: Layout vertical para agregar los widgets
         """
-        # Usuario
-        username_label = QLabel("Usuario:")
-        layout.addWidget(username_label)
-        
-        self.username_input = QLineEdit()
-        self.username_input.setPlaceholderText("Ingrese su usuario")
-        layout.addWidget(self.username_input)
-        
-        # Contraseña
-        password_label = QLabel("Contraseña:")
-        layout.addWidget(password_label)
+        if self._form_built:
+            return
         
-        self.password_input = QLineEdit()
-        self.password_input.setPlaceholderText("Ingrese su contraseña")
-        self.password_input.setEchoMode(QLineEdit.Password)
-        layout.addWidget(self.password_input)
+        # Se agregan todos los widgets con el repintado desactivado: un solo repintado al final
+        self.setUpdatesEnabled(False)
+        layout.setEnabled(False)
+        try:
+            # Usuario
+            username_label = QLabel("Usuario:")
+            layout.addWidget(username_label)
+            
+            self.username_input = QLineEdit()
+            self.username_input.setPlaceholderText("Ingrese su usuario")
+            self.username_input.setMaxLength(MAX_USERNAME_LEN)
+            layout.addWidget(self.username_input)
+            
+            # Contraseña
+            password_label = QLabel("Contraseña:")
+            layout.addWidget(password_label)
+            
+            self.password_input = QLineEdit()
+            self.password_input.setPlaceholderText("Ingrese su contraseña")
+            self.password_input.setEchoMode(QLineEdit.Password)
+            self.password_input.setMaxLength(MAX_PASSWORD_LEN)
+            layout.addWidget(self.password_input)
+            
+            # Enter en el usuario pasa a la contraseña; Enter en la contraseña inicia sesión
+            self.username_input.returnPressed.connect(self.password_input.setFocus)
+            self.password_input.returnPressed.connect(self.login)
+            
+            # Botón de inicio de sesión
+            self.setup_login_button(layout)
+            self._form_built = True
+        finally:
+            layout.setEnabled(True)
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def setup_login_button(self, layout):
         """Configura el botón de inicio de sesión."""
@@ -187,39 +251,131 @@ class LoginWindow(QMainWindow):
 
     def login(self):
         """Maneja el proceso de inicio de sesión."""
+        # Evita reentradas: mientras hay una verificación en curso el botón está deshabilitado
+        if not self.login_button.isEnabled():
+            return
+        
         username = self.username_input.text().strip()
-        password = self.password_input.text().strip()
+        # Sin strip: la contraseña se registró tal cual se escribió (ver RegisterDialog)
+        password = self.password_input.text()
         
         if not username or not password:
-            QMessageBox.warning(self, "Error", "Por favor ingrese usuario y contraseña")
+            self.show_warning("Por favor ingrese usuario y contraseña")
             return
         
-        try:
-            if self.user_manager.login(username, password):
-                self.open_desktop()
-            else:
-                QMessageBox.warning(self, "Error", "Usuario o contraseña incorrectos")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error al iniciar sesión: {str(e)}")
+        # El bloqueo es solo una marca de tiempo: no hay timers activos mientras dura
+        remaining = LoginWindow._lockout_until.get(username, 0.0) - time.monotonic()
+        if remaining > 0:
+            self.locked_label.setText(
+                f"Demasiados intentos fallidos.\nEspere {math.ceil(remaining)} segundos"
+            )
+            self._stack.setCurrentIndex(_LOCKED_PAGE)
+            return
+        
+        # Datos más largos que los límites no pueden ser válidos: se rechazan sin calcular
+        # bcrypt y sin contar como intento fallido (los campos ya limitan la longitud)
+        if len(username) > MAX_USERNAME_LEN or len(password) > MAX_PASSWORD_LEN:
+            self.show_warning("Usuario o contraseña incorrectos")
+            return
+        
+        # La verificación (bcrypt) se hace en un hilo aparte para no congelar la ventana.
+        # UserManager.authenticate tarda lo mismo con usuarios inexistentes y con
+        # contraseñas erróneas: ambos casos llegan a _on_login_result por el mismo camino
+        self.login_button.setEnabled(False)
+        worker = LoginWorker(self.user_manager, username, password)
+        # Conexiones en cola explícitas: los slots siempre se ejecutan en el hilo de la interfaz
+        worker.signals.finished.connect(
+            lambda ok: self._on_login_result(username, ok), Qt.QueuedConnection
+        )
+        worker.signals.error.connect(self._on_login_error, Qt.QueuedConnection)
+        # Se conserva la referencia a las señales mientras la tarea está en curso
+        self._login_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_login_result(self, username, ok):
+        """
+        Recibe el resultado de la verificación en el hilo de la interfaz.
+        
+        Args:
+            username: Nombre de usuario verificado
+            ok: True si las credenciales son válidas
+        """
+        self._login_signals = None
+        self.login_button.setEnabled(True)
+        if ok:
+            self.reset_login_attempts(username)
+            self._stack.setCurrentIndex(_FORM_PAGE)
+            self.user_manager.start_session(username)
+            self.open_desktop()
+        else:
+            # Tras _FREE_ATTEMPTS fallos, bloqueo de la cuenta con espera exponencial:
+            # 2, 4, 8... hasta 64 segundos
+            attempts = LoginWindow.login_attempts.get(username, 0) + 1
+            LoginWindow.login_attempts[username] = attempts
+            if attempts > _FREE_ATTEMPTS:
+                delay = 1 << min(attempts - _FREE_ATTEMPTS, 6)
+                LoginWindow._lockout_until[username] = time.monotonic() + delay
+            self.show_warning("Usuario o contraseña incorrectos")
+
+    def _on_login_error(self, message):
+        """
+        Muestra el error producido durante la verificación.
+        
+        Args:
+            message: Mensaje de error
+        """
+        self._login_signals = None
+        self.login_button.setEnabled(True)
+        self.show_error(f"Error al iniciar sesión: {message}")
+
+    def _prewarm_desktop(self):
+        """Importa el módulo del escritorio y precarga sus imágenes, sin construirlo."""
+        # Importación diferida: el escritorio (OpenCV, pyttsx3...) no retrasa la ventana de login.
+        # El video y los motores de voz solo se crean al abrir el escritorio
+        from gui.desktop import prewarm_assets
+        self._prewarm_step(prewarm_assets())
+
+    def _prewarm_step(self, steps):
+        """Carga la siguiente imagen del escritorio y programa la otra en el bucle de eventos."""
+        if self.desktop is not None:
+            return
+        if self._login_signals is not None:
+            # Crear pixmaps mientras un hilo del pool verifica la contraseña puede bloquear
+            # ambos hilos: la precarga se pospone hasta que termine la verificación
+            QTimer.singleShot(_PREWARM_DELAY_MS, lambda: self._prewarm_step(steps))
+            return
+        if next(steps, False) is not False:
+            QTimer.singleShot(0, lambda: self._prewarm_step(steps))
 
     def open_desktop(self):
         """Abre la ventana del escritorio después de un inicio de sesión exitoso."""
+        from gui.desktop import Desktop
         self.desktop = Desktop(self.user_manager)
         self.desktop.show()
         self.close()
 
     def center(self):
         """Centra la ventana en la pantalla."""
-        frame_geometry = self.frameGeometry()
-        screen_center = QDesktopWidget().availableGeometry().center()
-        frame_geometry.moveCenter(screen_center)
-        self.move(frame_geometry.topLeft())
+        center_on_screen(self)
 
-    def reset_login_attempts(self):
-        """Reinicia el contador de intentos de inicio de sesión."""
-        self.login_attempts = 0
-        self.lockout_timer.stop()
+    def reset_login_attempts(self, username):
+        """
+        Reinicia el contador de intentos de inicio de sesión de un usuario.
+        
+        Args:
+            username: Nombre de usuario
+        """
+        LoginWindow.login_attempts.pop(username, None)
+        LoginWindow._lockout_until.pop(username, None)
 
     def show_error(self, message):
         """Muestra un mensaje de error."""
-        QMessageBox.critical(self, "Error", message) 
\ No newline at end of file
+        self._error_box.setIcon(QMessageBox.Critical)
+        self._error_box.setText(message)
+        self._error_box.exec_()
+
+    def show_warning(self, message):
+        """Muestra un mensaje de advertencia."""
+        self._error_box.setIcon(QMessageBox.Warning)
+        self._error_box.setText(message)
+        self._error_box.exec_() 
\ No newline at end of file
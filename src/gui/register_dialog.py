@@ -5,51 +5,21 @@ from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                            QLineEdit, QPushButton, QMessageBox)
 from PyQt5.QtCore import Qt
 
+from core.user_manager import MAX_USERNAME_LEN, MAX_PASSWORD_LEN
+
 class RegisterDialog(QDialog):
     def __init__(self, user_manager, parent=None):
         super().__init__(parent)
         self.user_manager = user_manager
+        # Cuadro de mensajes reutilizado por todas las validaciones
+        self._msgbox = QMessageBox(self)
         self.init_ui()
 
     def init_ui(self):
         self.setWindowTitle('Registro - SistemaJuanchOS')
         self.setFixedSize(400, 300)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #1a1a1a;
-            }
-            QLabel {
-                color: white;
-                font-size: 14px;
-            }
-            QLineEdit {
-                padding: 10px;
-                border: 1px solid #333;
-                border-radius: 5px;
-                background-color: #2a2a2a;
-                color: white;
-                font-size: 14px;
-            }
-            QLineEdit:focus {
-                border: 1px solid #00ff00;
-            }
-            QPushButton {
-                padding: 10px;
-                background-color: #00ff00;
-                color: black;
-                border: none;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #00cc00;
-            }
-            QPushButton:disabled {
-                background-color: #666;
-                color: #999;
-            }
-        """)
+        # El estilo está en assets/register.qss y se aplica a toda la aplicación (ver main.py)
+        self.setObjectName("registerDialog")
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(40, 40, 40, 40)
@@ -58,7 +28,7 @@ class RegisterDialog(QDialog):
         # Título
         title = QLabel('Registro de Usuario')
         title.setAlignment(Qt.AlignCenter)
-        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        title.setObjectName("registerTitle")
         layout.addWidget(title)
         
         # Formulario
@@ -74,6 +44,7 @@ class RegisterDialog(QDialog):
         
         self.username_input = QLineEdit()
         self.username_input.setPlaceholderText("Ingrese un nombre de usuario")
+        self.username_input.setMaxLength(MAX_USERNAME_LEN)
         layout.addWidget(self.username_input)
         
         # Contraseña
@@ -83,6 +54,7 @@ class RegisterDialog(QDialog):
         self.password_input = QLineEdit()
         self.password_input.setPlaceholderText("Ingrese una contraseña")
         self.password_input.setEchoMode(QLineEdit.Password)
+        self.password_input.setMaxLength(MAX_PASSWORD_LEN)
         layout.addWidget(self.password_input)
         
         # Confirmar contraseña
@@ -92,16 +64,25 @@ class RegisterDialog(QDialog):
         self.confirm_input = QLineEdit()
         self.confirm_input.setPlaceholderText("Confirme su contraseña")
         self.confirm_input.setEchoMode(QLineEdit.Password)
+        self.confirm_input.setMaxLength(MAX_PASSWORD_LEN)
         layout.addWidget(self.confirm_input)
+        
+        # Enter avanza de campo en campo y en la confirmación registra directamente
+        self.username_input.returnPressed.connect(self.password_input.setFocus)
+        self.password_input.returnPressed.connect(self.confirm_input.setFocus)
+        self.confirm_input.returnPressed.connect(self.register)
 
     def setup_buttons(self, layout):
         button_layout = QHBoxLayout()
         
         self.register_button = QPushButton("Registrar")
+        # Sin botón por defecto: Enter ya está conectado a cada campo (ver setup_form)
+        self.register_button.setAutoDefault(False)
         self.register_button.clicked.connect(self.register)
         button_layout.addWidget(self.register_button)
         
         self.cancel_button = QPushButton("Cancelar")
+        self.cancel_button.setAutoDefault(False)
         self.cancel_button.clicked.connect(self.reject)
         button_layout.addWidget(self.cancel_button)
         
@@ -109,31 +90,48 @@ class RegisterDialog(QDialog):
 
     def register(self):
         username = self.username_input.text().strip()
-        password = self.password_input.text().strip()
-        confirm = self.confirm_input.text().strip()
+        # La contraseña se guarda tal cual se escribió, espacios incluidos
+        password = self.password_input.text()
+        confirm = self.confirm_input.text()
         
         # Validaciones
         if not username or not password or not confirm:
-            QMessageBox.warning(self, "Error", "Por favor complete todos los campos")
+            self.show_message("Por favor complete todos los campos")
             return
         
         if password != confirm:
-            QMessageBox.warning(self, "Error", "Las contraseñas no coinciden")
+            self.show_message("Las contraseñas no coinciden")
             return
         
         if len(username) < 3:
-            QMessageBox.warning(self, "Error", "El nombre de usuario debe tener al menos 3 caracteres")
+            self.show_message("El nombre de usuario debe tener al menos 3 caracteres")
             return
         
         if len(password) < 6:
-            QMessageBox.warning(self, "Error", "La contraseña debe tener al menos 6 caracteres")
+            self.show_message("La contraseña debe tener al menos 6 caracteres")
+            return
+        
+        # Límite superior antes de llegar a bcrypt
+        if len(username) > MAX_USERNAME_LEN:
+            self.show_message(f"El nombre de usuario no puede superar {MAX_USERNAME_LEN} caracteres")
+            return
+        
+        if len(password) > MAX_PASSWORD_LEN:
+            self.show_message(f"La contraseña no puede superar {MAX_PASSWORD_LEN} caracteres")
             return
         
         try:
-            if self.user_manager.register_user(username, password):
-                QMessageBox.information(self, "Éxito", "Usuario registrado correctamente")
+            if self.user_manager.create_user(username, password):
+                self.show_message("Usuario registrado correctamente", QMessageBox.Information, "Éxito")
                 self.accept()
             else:
-                QMessageBox.warning(self, "Error", "El usuario ya existe")
+                self.show_message("El usuario ya existe")
         except Exception as e:
-            QMessageBox.critical(self, "Error", f"Error al registrar usuario: {str(e)}") 
\ No newline at end of file
+            self.show_message(f"Error al registrar usuario: {str(e)}", QMessageBox.Critical)
+
+    def show_message(self, text, icon=QMessageBox.Warning, title="Error"):
+        """Muestra un mensaje reutilizando el mismo cuadro de diálogo."""
+        self._msgbox.setIcon(icon)
+        self._msgbox.setWindowTitle(title)
+        self._msgbox.setText(text)
+        self._msgbox.exec_()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Recursos de la Interfaz Gráfica
+========================================
+
+Este módulo centraliza el acceso a los recursos de la interfaz gráfica
+(imágenes y hojas de estilo), que se leen desde el directorio assets.
+
+Funciones:
+----------
+- asset_path: Obtiene la ruta de un recurso
+- read_text_asset: Lee el contenido de un recurso de texto
+- rounded_logo_pixmap: Obtiene el logo con las esquinas redondeadas
+"""
+
+import os
+from functools import lru_cache
+
+from PyQt5.QtCore import Qt, QFile, QIODevice, QRectF
+from PyQt5.QtGui import QPixmap, QPainter, QPainterPath
+
+# Directorio de los recursos en disco
+ASSETS_DIR = os.path.join(os.path.dirname(__file__), 'assets')
+
+def asset_path(name):
+    """
+    Obtiene la ruta de un recurso, válida para QPixmap, QIcon y QFile.
+    
+    Args:
+        name: Nombre del archivo dentro de assets
+    
+    Returns:
+        str: Ruta del recurso
+    """
+    return os.path.join(ASSETS_DIR, name)
+
+@lru_cache(maxsize=None)
+def read_text_asset(name):
+    """
+    Lee el contenido de un recurso de texto.
+    
+    El resultado se guarda en memoria: cada recurso se lee una sola vez por proceso.
+    
+    Args:
+        name: Nombre del archivo dentro de assets
+    
+    Returns:
+        str: Contenido del recurso, o cadena vacía si no se pudo leer
+    """
+    file = QFile(asset_path(name))
+    if not file.open(QIODevice.ReadOnly | QIODevice.Text):
+        print(f"Error al leer el recurso: {name}")
+        return ""
+    try:
+        return bytes(file.readAll()).decode('utf-8')
+    finally:
+        file.close()
+
+@lru_cache(maxsize=1)
+def rounded_logo_pixmap():
+    """
+    Obtiene el logo con las esquinas redondeadas.
+    
+    Se construye una sola vez y lo comparten la ventana de inicio de sesión y el
+    menú de inicio; cada uno escala la copia compartida al tamaño que necesita.
+    
+    Returns:
+        QPixmap: Logo redondeado (nulo si no se pudo cargar)
+    """
+    original_pixmap = QPixmap(asset_path('logo.png'))
+    if original_pixmap.isNull():
+        return original_pixmap
+    
+    # Una sola pasada: se recorta con un trazado redondeado y se dibuja el original encima
+    rounded_pixmap = QPixmap(original_pixmap.size())
+    rounded_pixmap.fill(Qt.transparent)
+    path = QPainterPath()
+    path.addRoundedRect(QRectF(rounded_pixmap.rect()), 50, 50)
+    painter = QPainter(rounded_pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setClipPath(path)
+    painter.drawPixmap(0, 0, original_pixmap)
+    painter.end()
+    
+    return rounded_pixmap
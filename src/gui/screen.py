@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Geometría de Pantalla
+==============================
+
+Este módulo guarda la geometría de la pantalla principal para que las ventanas
+del sistema (inicio de sesión, escritorio y terminal) se centren sin volver a
+consultar al sistema de ventanas cada vez que se abren.
+
+Funciones:
+----------
+- screen_center: Obtiene el centro del área disponible de la pantalla principal
+- center_on_screen: Centra una ventana en la pantalla principal
+"""
+
+from PyQt5.QtWidgets import QApplication
+
+# Centro del área disponible de la pantalla principal, calculado una sola vez
+_SCREEN_CENTER = None
+
+def screen_center():
+    """
+    Obtiene el centro del área disponible de la pantalla principal.
+    
+    Returns:
+        QPoint: Centro de la pantalla
+    """
+    global _SCREEN_CENTER
+    if _SCREEN_CENTER is None:
+        _SCREEN_CENTER = QApplication.primaryScreen().availableGeometry().center()
+    return _SCREEN_CENTER
+
+def center_on_screen(window):
+    """
+    Centra una ventana en la pantalla principal.
+    
+    Args:
+        window: Ventana a centrar
+    """
+    frame_geometry = window.frameGeometry()
+    frame_geometry.moveCenter(screen_center())
+    window.move(frame_geometry.topLeft())
@@ -19,39 +19,78 @@ Clases:
 """
 
 # Importación de módulos de Qt para la interfaz gráfica
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QTextEdit,
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QPlainTextEdit,
                            QLineEdit, QPushButton, QHBoxLayout, QLabel, QMessageBox)
-from PyQt5.QtCore import Qt, QSize
+from PyQt5.QtCore import Qt, QSize, QTimer, QEvent
 from PyQt5.QtGui import QFont, QTextCursor, QColor, QTextCharFormat
 
 # Importación de módulos del sistema
 import sys
 import os
+from collections import deque
 
 # Importación de módulos locales
 from core.file_system import FileSystem
 from core.process_manager import ProcessManager
 from core.memory_manager import MemoryManager
 from core.command_interface import CommandInterface
+from shell.trie import Trie
+from gui.screen import center_on_screen
+
+# Número máximo de líneas que conserva el área de salida
+MAX_OUTPUT_LINES = 5000
+# Longitud máxima de una línea de salida; lo que sobra se recorta
+MAX_LINE_LENGTH = 2000
+# Número máximo de comandos que conserva el historial
+MAX_HISTORY = 1000
+
+# Mensaje de bienvenida; se vuelca junto con el resto de la salida inicial
+_WELCOME = """
+        Bienvenido a la Terminal de SistemaJuanchOS
+        -----------------------------------------
+        Comandos disponibles:
+        - help: Muestra esta ayuda
+        - mkdir: Crea un directorio
+        - cd: Cambia de directorio
+        - ls: Lista archivos
+        - touch: Crea un archivo
+        - cat: Muestra contenido de archivo
+        - echo: Escribe en archivo
+        - rm: Elimina archivo
+        - pwd: Muestra directorio actual
+        - exit: Cierra la terminal
+        """
 
 class TerminalWindow(QMainWindow):
     """
     Implementa la ventana principal de la terminal del sistema operativo.
     
+    Atributos de clase:
+        _TERM_FONT: Fuente monoespaciada de la salida
+        _TERM_GREEN: Color del texto de la salida
+        _TERM_FMT: Formato de carácter aplicado a la salida
+    
     Atributos:
         user_manager: Gestor de usuarios del sistema
         file_system: Sistema de archivos
         process_manager: Gestor de procesos
         memory_manager: Gestor de memoria
         command_interface: Interfaz de comandos
+        _command_trie: Árbol de prefijos de los nombres de comando, para autocompletar
         output_text: Widget de texto para la salida
         input_line: Widget de línea para la entrada
-        command_history: Lista de comandos ejecutados
+        command_history: Comandos ejecutados, sin repetir y acotados a MAX_HISTORY
         current_history_index: Índice actual en el historial
         prompt: Símbolo del prompt
         current_dir: Directorio actual
     """
     
+    # Fuente, color y formato de la salida; se crean con la primera ventana (requieren
+    # una QApplication) y las comparten todas las terminales
+    _TERM_FONT = None
+    _TERM_GREEN = None
+    _TERM_FMT = None
+    
     def __init__(self, user_manager, parent=None):
         """
         Inicializa la ventana de la terminal.
@@ -63,10 +102,11 @@ class TerminalWindow(QMainWindow):
         super().__init__(parent)
         self.user_manager = user_manager
         
-        # Inicializa los gestores del sistema
-        self.file_system = FileSystem()
-        self.process_manager = ProcessManager()
-        self.memory_manager = MemoryManager()
+        # Reutiliza los gestores del sistema que main.py asocia al gestor de usuarios;
+        # solo se crean nuevos si la terminal se abre fuera de la aplicación completa
+        self.file_system = self._shared_manager('file_system', FileSystem)
+        self.process_manager = self._shared_manager('process_manager', ProcessManager)
+        self.memory_manager = self._shared_manager('memory_manager', MemoryManager)
         
         # Configura la interfaz de comandos
         self.command_interface = CommandInterface(
@@ -75,14 +115,24 @@ class TerminalWindow(QMainWindow):
             self.memory_manager,
             self.user_manager
         )
+        # Los comandos no cambian: su árbol de autocompletado se construye una vez
+        self._command_trie = Trie(self.command_interface.commands)
+        
+        # Salida pendiente de mostrar: se vuelca de una vez en el siguiente ciclo de eventos
+        self._pending = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_output)
         
         # Inicializa variables de estado
-        self.command_history = []
+        self.command_history = deque(maxlen=MAX_HISTORY)
+        self._history_set = set()  # Mismos comandos que command_history, para búsquedas O(1)
         self.current_history_index = -1
         self.prompt = "$ "
         self.current_dir = "/"
         
         # Configura la interfaz
+        self._init_text_format()
         self.init_ui()
         self.show_welcome_message()
 
@@ -93,14 +143,8 @@ class TerminalWindow(QMainWindow):
         """
         self.setWindowTitle('Terminal - SistemaJuanchOS')
         self.setFixedSize(800, 600)
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #000000;
-            }
-            QWidget {
-                background-color: #000000;
-            }
-        """)
+        # El estilo está en assets/terminal.qss y se aplica a toda la aplicación (ver main.py)
+        self.setObjectName("terminalWindow")
 
         # Widget central
         central_widget = QWidget()
@@ -110,31 +154,12 @@ class TerminalWindow(QMainWindow):
         layout.setSpacing(5)
 
         # Área de texto para la salida
-        self.text_area = QTextEdit()
+        self.text_area = QPlainTextEdit()
         self.text_area.setReadOnly(True)
-        self.text_area.setStyleSheet("""
-            QTextEdit {
-                background-color: #000000;
-                color: #00ff00;
-                font-family: 'Consolas', monospace;
-                font-size: 14px;
-                border: none;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #1a1a1a;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #333333;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-        """)
+        # Salida acotada: al superar el límite se descartan las líneas más antiguas
+        self.text_area.setMaximumBlockCount(MAX_OUTPUT_LINES)
+        self.text_area.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.text_area.setFont(TerminalWindow._TERM_FONT)
         layout.addWidget(self.text_area)
 
         # Línea de entrada
@@ -142,63 +167,63 @@ class TerminalWindow(QMainWindow):
         
         # Etiqueta del prompt
         self.prompt_label = QLabel("$ ")
-        self.prompt_label.setStyleSheet("""
-            QLabel {
-                color: #00ff00;
-                font-family: 'Consolas', monospace;
-                font-size: 14px;
-                background-color: transparent;
-            }
-        """)
         input_layout.addWidget(self.prompt_label)
 
         # Campo de entrada
         self.input_line = QLineEdit()
-        self.input_line.setStyleSheet("""
-            QLineEdit {
-                background-color: #000000;
-                color: #00ff00;
-                font-family: 'Consolas', monospace;
-                font-size: 14px;
-                border: none;
-            }
-        """)
         self.input_line.returnPressed.connect(self.execute_command)
+        # Tab autocompleta en lugar de mover el foco
+        self.input_line.installEventFilter(self)
         input_layout.addWidget(self.input_line)
         layout.addLayout(input_layout)
 
         # Centra la ventana
         self.center_window()
 
+    def _shared_manager(self, name, factory):
+        """
+        Obtiene un gestor del sistema compartido a través del gestor de usuarios.
+        
+        Args:
+            name: Nombre del atributo en user_manager
+            factory: Clase con la que crear el gestor si no existe
+        
+        Returns:
+            Gestor compartido, o uno nuevo si user_manager no lo tiene
+        """
+        manager = getattr(self.user_manager, name, None)
+        if manager is None:
+            manager = factory()
+            setattr(self.user_manager, name, manager)
+        return manager
+
+    @classmethod
+    def _init_text_format(cls):
+        """
+        Crea una sola vez la fuente, el color y el formato de la salida.
+        """
+        if cls._TERM_FMT is not None:
+            return
+        cls._TERM_FONT = QFont("Consolas")
+        cls._TERM_FONT.setStyleHint(QFont.Monospace)
+        cls._TERM_FONT.setPixelSize(14)
+        cls._TERM_GREEN = QColor(0, 255, 0)
+        cls._TERM_FMT = QTextCharFormat()
+        cls._TERM_FMT.setForeground(cls._TERM_GREEN)
+        cls._TERM_FMT.setFont(cls._TERM_FONT)
+
     def center_window(self):
         """
         Centra la ventana de la terminal en la pantalla.
         """
-        frame_geometry = self.frameGeometry()
-        screen_center = self.screen().availableGeometry().center()
-        frame_geometry.moveCenter(screen_center)
-        self.move(frame_geometry.topLeft())
+        center_on_screen(self)
 
     def show_welcome_message(self):
         """
         Muestra el mensaje de bienvenida y la lista de comandos disponibles.
         """
-        welcome = """
-        Bienvenido a la Terminal de SistemaJuanchOS
-        -----------------------------------------
-        Comandos disponibles:
-        - help: Muestra esta ayuda
-        - mkdir: Crea un directorio
-        - cd: Cambia de directorio
-        - ls: Lista archivos
-        - touch: Crea un archivo
-        - cat: Muestra contenido de archivo
-        - echo: Escribe en archivo
-        - rm: Elimina archivo
-        - pwd: Muestra directorio actual
-        - exit: Cierra la terminal
-        """
-        self.append_output(welcome)
+        self._pending.append(_WELCOME)
+        self._flush_timer.start(0)
 
     def execute_command(self):
         """
@@ -212,6 +237,7 @@ class TerminalWindow(QMainWindow):
             return
 
         self.append_output(f"$ {command}")
+        self.add_to_history(command)
         
         # Verifica que los gestores del sistema estén disponibles
         if not self.user_manager or not self.user_manager.file_system:
@@ -226,15 +252,105 @@ class TerminalWindow(QMainWindow):
             if result == "exit":
                 self.close()
 
+    def eventFilter(self, obj, event):
+        """
+        Intercepta la tecla Tab en la línea de entrada para autocompletar.
+        """
+        if obj is self.input_line and event.type() == QEvent.KeyPress and event.key() == Qt.Key_Tab:
+            self.complete_input()
+            return True
+        return super().eventFilter(obj, event)
+
+    def complete_input(self):
+        """
+        Autocompleta la última palabra de la entrada.
+        La primera palabra se completa con los comandos y las demás con los nombres
+        del directorio actual; si hay varias opciones se muestran en la salida.
+        """
+        text = self.input_line.text()
+        head, sep, word = text.rpartition(' ')
+        if sep:
+            try:
+                items = self.file_system.list_directory(self.command_interface.current_dir)
+            except ValueError:
+                items = []
+            # Los nombres cambian con cada orden: se filtran directamente, sin construir
+            # un árbol que solo serviría para esta pulsación
+            matches = sorted({item.name for item in items if item.name.startswith(word)})
+        else:
+            matches = self._command_trie.complete(word)
+        
+        if not matches:
+            return
+        if len(matches) == 1:
+            completion = matches[0] + ' '
+        else:
+            completion = os.path.commonprefix(matches)
+            if completion == word:
+                self.append_output("  ".join(matches))
+                return
+        self.input_line.setText(head + sep + completion)
+
+    def add_to_history(self, command):
+        """
+        Registra un comando en el historial si no estaba ya.
+        
+        Args:
+            command: Comando ejecutado
+        """
+        if command in self._history_set:
+            return
+        if len(self.command_history) == self.command_history.maxlen:
+            # El deque descartará el más antiguo: se quita también del conjunto
+            self._history_set.discard(self.command_history[0])
+        self.command_history.append(command)
+        self._history_set.add(command)
+        self.current_history_index = len(self.command_history)
+
     def append_output(self, text):
         """
         Agrega texto al área de salida.
         
+        El texto se acumula y se vuelca junto con el resto de la salida pendiente,
+        de modo que varias líneas seguidas producen un único reajuste del documento.
+        
         Args:
             text: Texto a agregar
         """
-        self.text_area.append(text)
-        self.text_area.moveCursor(QTextCursor.End)
+        # Solo un texto más largo que el límite puede contener líneas que recortar
+        if len(text) > MAX_LINE_LENGTH:
+            text = "\n".join(
+                line if len(line) <= MAX_LINE_LENGTH else line[:MAX_LINE_LENGTH] + " …"
+                for line in text.split("\n")
+            )
+        self._pending.append(text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(0)
+
+    def _flush_output(self):
+        """
+        Vuelca la salida pendiente al área de texto con una sola inserción.
+        """
+        if not self._pending:
+            return
+        text = "\n".join(self._pending)
+        self._pending.clear()
+        
+        # Solo se sigue el final si el usuario no se ha desplazado hacia arriba
+        scrollbar = self.text_area.verticalScrollBar()
+        at_bottom = scrollbar.value() >= scrollbar.maximum()
+        
+        self.text_area.setUpdatesEnabled(False)
+        try:
+            cursor = QTextCursor(self.text_area.document())
+            cursor.movePosition(QTextCursor.End)
+            if not self.text_area.document().isEmpty():
+                text = "\n" + text
+            cursor.insertText(text, TerminalWindow._TERM_FMT)
+        finally:
+            self.text_area.setUpdatesEnabled(True)
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
     def closeEvent(self, event):
         """
@@ -28,18 +28,14 @@ current_dir = os.path.dirname(os.path.abspath(__file__))  # Obtiene el directori
 if current_dir not in sys.path:  # Verifica si el directorio ya está en el path
     sys.path.append(current_dir)  # Agrega el directorio al path si no está
 
-# Importación de módulos de Qt para la interfaz gráfica
-from PyQt5.QtWidgets import QApplication  # Clase principal para aplicaciones Qt
-from PyQt5.QtCore import Qt
-
 # Importación de los gestores del sistema
 from core.user_manager import UserManager      # Gestor de usuarios
 from core.file_system import FileSystem        # Sistema de archivos
 from core.process_manager import ProcessManager # Gestor de procesos
 from core.memory_manager import MemoryManager  # Gestor de memoria
 
-# Importación de la interfaz gráfica
-from gui.login_window import LoginWindow  # Ventana de inicio de sesión
+# Hojas de estilo de las ventanas, cada una limitada a su objectName
+_STYLESHEETS = ('login.qss', 'register.qss', 'terminal.qss')
 
 def main():
     """
@@ -55,9 +51,17 @@ def main():
     Returns:
         int: Código de salida de la aplicación
     """
+    # Qt y la interfaz gráfica se importan aquí: importar este módulo sin abrir la
+    # interfaz (pruebas, uso solo de los gestores) no carga PyQt5
+    from PyQt5.QtWidgets import QApplication  # Clase principal para aplicaciones Qt
+    from gui.login_window import LoginWindow  # Ventana de inicio de sesión
+    from gui.resources import read_text_asset # Recursos (imágenes y hojas de estilo)
+    
     # Crear la aplicación Qt
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Estilo moderno y consistente
+    # Hoja de estilo global de todas las ventanas: Qt la analiza una sola vez
+    app.setStyleSheet(''.join(read_text_asset(name) for name in _STYLESHEETS))
     
     try:
         # Inicializar los gestores del sistema
@@ -68,6 +72,8 @@ def main():
         
         # Configurar dependencias entre gestores
         user_manager.file_system = file_system
+        user_manager.process_manager = process_manager
+        user_manager.memory_manager = memory_manager
         process_manager.memory_manager = memory_manager
         
         # Mostrar la ventana de inicio de sesión
@@ -75,7 +81,9 @@ def main():
         login_window.show()  # Muestra la ventana
         
         # Ejecutar el bucle principal
-        return app.exec_()
+        exit_code = app.exec_()
+        file_system.close()  # Espera a que se escriban los cambios pendientes del sistema de archivos
+        return exit_code
         
     except Exception as e:
         # Manejo de errores durante la inicialización
@@ -84,4 +92,4 @@ def main():
 
 # Punto de entrada del programa
 if __name__ == "__main__":
-    sys.exit(main())  # Ejecuta la función principal si el script se ejecuta directamente 
\ No newline at end of file
+    raise SystemExit(main())  # Ejecuta la función principal y termina con su código de salida 
\ No newline at end of file
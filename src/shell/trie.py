@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Autocompletado de la Terminal
+=====================================
+
+Este módulo implementa un árbol de prefijos (trie) para autocompletar comandos
+y nombres de archivo en la terminal.
+
+Clases:
+--------
+- TrieNode: Nodo del árbol de prefijos
+- Trie: Árbol de prefijos con búsqueda por prefijo
+"""
+
+class TrieNode:
+    """
+    Representa un nodo del árbol de prefijos.
+
+    Los hijos se guardan en una lista de 256 posiciones indexada por byte (las
+    palabras se recorren en UTF-8), así que bajar un nivel es un acceso directo.
+
+    Atributos:
+        children: Hijos del nodo, uno por valor de byte
+        is_word: Indica si en este nodo termina una palabra
+    """
+
+    __slots__ = ('children', 'is_word')
+
+    def __init__(self):
+        self.children = [None] * 256
+        self.is_word = False
+
+class Trie:
+    """
+    Implementa un árbol de prefijos de palabras.
+
+    Atributos:
+        root: Nodo raíz
+
+    Métodos:
+        insert: Agrega una palabra
+        complete: Obtiene las palabras que empiezan por un prefijo
+    """
+
+    def __init__(self, words=()):
+        """
+        Inicializa el árbol con las palabras dadas.
+
+        Args:
+            words: Palabras iniciales
+        """
+        self.root = TrieNode()
+        for word in words:
+            self.insert(word)
+
+    def insert(self, word):
+        """
+        Agrega una palabra al árbol.
+
+        Args:
+            word: Palabra a agregar
+        """
+        node = self.root
+        for byte in word.encode('utf-8'):
+            child = node.children[byte]
+            if child is None:
+                child = node.children[byte] = TrieNode()
+            node = child
+        node.is_word = True
+
+    def complete(self, prefix):
+        """
+        Obtiene las palabras que empiezan por un prefijo, en orden.
+
+        Args:
+            prefix: Prefijo a completar
+
+        Returns:
+            list: Palabras que empiezan por el prefijo (vacía si no hay ninguna)
+        """
+        node = self.root
+        start = prefix.encode('utf-8')
+        for byte in start:
+            node = node.children[byte]
+            if node is None:
+                return []
+
+        # Recorrido en profundidad por orden de byte: en UTF-8 coincide con el orden
+        # de los caracteres, así que el resultado sale ya ordenado
+        words = []
+        pending = [(node, start)]
+        while pending:
+            node, word = pending.pop()
+            if node.is_word:
+                words.append(word.decode('utf-8'))
+            for byte in range(255, -1, -1):
+                child = node.children[byte]
+                if child is not None:
+                    pending.append((child, word + bytes((byte,))))
+        return words